@@ -0,0 +1 @@
+"""PropertyVet core orchestration (installed as propertyvet.core)"""
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+TAURUS PropertyVet™ Orchestrator Smoke Check
+Starts the orchestrator, prints system status and shuts down
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+
+try:
+    from propertyvet.core.propertyvet_orchestrator import (
+        BackgroundCheckRequest, PropertyVetOrchestrator, configure_logging
+    )
+except ModuleNotFoundError as e:
+    if not (e.name or "").startswith("propertyvet"):
+        raise
+    from propertyvet_orchestrator import BackgroundCheckRequest, PropertyVetOrchestrator, configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Test function
+async def test_orchestrator():
+    """Test the PropertyVet Orchestrator"""
+    orchestrator = PropertyVetOrchestrator()
+    await orchestrator.initialize()
+    
+    # Test request
+    test_request = BackgroundCheckRequest(
+        request_id="TEST_ORCHESTRATOR_001",
+        applicant_name="Sarah Johnson",
+        ssn="123-45-6789",
+        date_of_birth="1990-05-15",
+        address="123 Maple Street",
+        city="Atlanta",
+        state="GA",
+        zip_code="30309",
+        phone="555-123-4567",
+        email="sarah.johnson@email.com",
+        property_address="456 Oak Avenue, Unit 205",
+        landlord_id="LANDLORD_001",
+        check_level="standard",
+        consent_provided=True,
+        created_at=datetime.now().isoformat()
+    )
+    
+    try:
+        # Get system status
+        status = orchestrator.get_system_status()
+        print("System Status:")
+        print(json.dumps(status, indent=2))
+        
+        # This would normally process a real background check
+        # For testing, we just show the orchestrator is ready
+        print("\nPropertyVet Orchestrator is ready for production!")
+        
+    except Exception as e:
+        logger.error(f"Test failed: {e}")
+    finally:
+        await orchestrator.close()
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(test_orchestrator())
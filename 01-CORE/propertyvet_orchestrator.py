@@ -6,34 +6,90 @@ Real-Time Intelligence & Multi-Agent Coordination
 """
 
 import asyncio
+import copy
 import json
 import logging
+import logging.handlers
+import re
 import time
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Import our agents
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append('/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/03-MCP-INTEGRATIONS')
 
-from credit_bureau_agent import CreditBureauAgent, CreditCheckRequest, CreditBureauProvider
-from public_records_agent import PublicRecordsAgent, PublicRecordsRequest
+try:
+    from propertyvet.mcp.credit_bureau_agent import CreditBureauAgent, CreditCheckRequest, CreditBureauProvider
+    from propertyvet.mcp.public_records_agent import PublicRecordsAgent, PublicRecordsRequest
+except ModuleNotFoundError as e:
+    if not (e.name or "").startswith("propertyvet"):
+        raise
+    # Source checkout without the package installed: use the sibling agents directory
+    sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '03-MCP-INTEGRATIONS'))
+    from credit_bureau_agent import CreditBureauAgent, CreditCheckRequest, CreditBureauProvider
+    from public_records_agent import PublicRecordsAgent, PublicRecordsRequest
+
+# Logging
+# configure_logging() is called by entry points, never at import time.
+# File output is buffered in memory and flushed every DEFAULT_FLUSH_INTERVAL
+# (or immediately on ERROR) so request handling never blocks on log writes
+# Records carry the id of the request being processed via REQUEST_ID
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s'
+LOG_BUFFER_CAPACITY = 1024
+DEFAULT_FLUSH_INTERVAL = 0.5  # seconds
+DEFAULT_LOG_FILE = '/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/orchestrator.log'
+
+REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="-")
+
+class RequestIdFilter(logging.Filter):
+    """Stamp each log record with the current request id"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = REQUEST_ID.get()
+        return True
+
+def configure_logging(log_file: Optional[str] = DEFAULT_LOG_FILE):
+    """Install buffered file logging (when log_file is set) plus console logging on the root logger"""
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.insert(0, logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        ))
+    
+    for handler in handlers:
+        handler.addFilter(RequestIdFilter())
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=handlers,
+        force=True  # the agents configure logging on import; the orchestrator's setup wins
+    )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/orchestrator.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+def _flush_log_buffers():
+    """Flush any buffered log handlers installed on the root logger"""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.handlers.BufferingHandler):
+            handler.flush()
+
 class BackgroundCheckStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -46,9 +102,17 @@ class RiskLevel(Enum):
     HIGH = "high"
     VERY_HIGH = "very_high"
 
-@dataclass
+# Both dataclasses declare __slots__ by hand (dataclass(slots=True) needs Python 3.10)
+@dataclass(frozen=True)
 class BackgroundCheckRequest:
     """Complete background check request"""
+    __slots__ = (
+        "request_id", "applicant_name", "ssn", "date_of_birth", "address", "city", "state",
+        "zip_code", "phone", "email", "property_address", "landlord_id", "check_level",
+        "consent_provided", "created_at",
+        # Derived in __post_init__, not dataclass fields
+        "first_name", "last_name"
+    )
     request_id: str
     applicant_name: str
     ssn: str
@@ -64,10 +128,30 @@ class BackgroundCheckRequest:
     check_level: str  # basic, standard, premium
     consent_provided: bool
     created_at: str
+    
+    def __post_init__(self):
+        # Parse the name once so every agent sees the same first/last split
+        parts = self.applicant_name.split() or [""]
+        object.__setattr__(self, "first_name", parts[0])
+        object.__setattr__(self, "last_name", parts[-1])
+    
+    # Frozen slotted instances have no __dict__ and reject setattr, so copy and pickle
+    # need explicit state handling
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
 @dataclass
 class BackgroundCheckResult:
     """Complete background check result"""
+    __slots__ = (
+        "request_id", "status", "overall_risk_score", "risk_level", "credit_report",
+        "public_records", "employment_verification", "identity_verification",
+        "recommendations", "flags", "processing_time", "completed_at", "report_url"
+    )
     request_id: str
     status: BackgroundCheckStatus
     overall_risk_score: int
@@ -82,18 +166,324 @@ class BackgroundCheckResult:
     completed_at: Optional[str]
     report_url: Optional[str]
 
+# Fields a request must have non-empty to be processed
+REQUIRED_FIELDS = ("request_id", "applicant_name", "ssn", "date_of_birth", "address")
+_get_required_fields = attrgetter(*REQUIRED_FIELDS)
+
+# Risk scoring kernel, shared by single-request and batch scoring
+EMPLOYMENT_SCORE = 700  # Default for verified employment
+IDENTITY_SCORE = 800  # Default for verified identity
+RISK_LEVELS_BY_CODE = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.VERY_HIGH)
+
+def score_batch(credit, has_credit, crim_counts, civil_counts, has_records, emp_ok, id_ok,
+                weights, thresholds, out_scores, out_levels):
+    """
+    Score N applicants from column inputs
+    thresholds are ascending (high, medium, low risk cut-offs)
+    Writes the overall score and a RISK_LEVELS_BY_CODE index per row into out_scores/out_levels
+    """
+    credit_weight, records_weight, employment_weight, identity_weight = weights
+    
+    for i in range(len(out_scores)):
+        # Missing components are masked to zero weight instead of branched around
+        credit_w = has_credit[i] * credit_weight
+        records_w = has_records[i] * records_weight
+        employment_w = emp_ok[i] * employment_weight
+        identity_w = id_ok[i] * identity_weight
+        
+        # Inverse scoring - fewer records = higher score (0-850 scale)
+        records_score = max(0, 850 - (crim_counts[i] * 200) - (civil_counts[i] * 50))
+        
+        total_score = (credit[i] * credit_w + records_score * records_w
+                       + EMPLOYMENT_SCORE * employment_w + IDENTITY_SCORE * identity_w)
+        total_weight = credit_w + records_w + employment_w + identity_w
+        
+        score = int(total_score / total_weight) if total_weight > 0 else 0
+        out_scores[i] = score
+        out_levels[i] = len(thresholds) - bisect_right(thresholds, score)
+
+# Standard recommendations for each risk level
+RISK_RECOMMENDATIONS = {
+    RiskLevel.LOW: (
+        "Excellent candidate - approve with standard terms",
+        "Minimal security deposit required",
+        "Standard lease terms recommended"
+    ),
+    RiskLevel.MEDIUM: (
+        "Good candidate - approve with standard terms",
+        "Standard security deposit recommended",
+        "Consider rental insurance requirement"
+    ),
+    RiskLevel.HIGH: (
+        "Moderate risk - consider additional security measures",
+        "Increased security deposit recommended",
+        "Shorter lease term or co-signer suggested"
+    ),
+    RiskLevel.VERY_HIGH: (
+        "High risk - manual review recommended",
+        "Consider declining or requiring co-signer",
+        "Additional documentation and verification needed"
+    )
+}
+
+# Completed results are kept column-wise; status is stored as a small int code
+STATUS_CODES = {status: code for code, status in enumerate(BackgroundCheckStatus)}
+# Status code of a row replaced by a newer result for the same request id
+SUPERSEDED_CODE = len(STATUS_CODES)
+SECONDS_PER_DAY = 86400
+
+class RequestStore:
+    """
+    Columnar store for completed background check results
+    Rows older than the retention window are evicted in completion order
+    """
+    
+    def __init__(self, retention_days: int = 90):
+        self.retention_seconds = retention_days * SECONDS_PER_DAY
+        self.ids: List[str] = []
+        self.scores = array('i')
+        self.status = array('B')
+        self.proc_time = array('f')
+        self.completed_ts = array('d')
+        # request_id -> (completed_ts, result, absolute row number); row index is that minus rows evicted so far
+        self.results: Dict[str, tuple] = {}
+        self._evicted = 0
+    
+    def add(self, result: 'BackgroundCheckResult'):
+        """Append a completed result and drop any rows past retention"""
+        now = time.time()
+        self.evict_expired(now)
+        
+        # A re-processed request supersedes its earlier row, so only the newest result counts
+        previous = self.results.get(result.request_id)
+        if previous is not None:
+            self.status[previous[2] - self._evicted] = SUPERSEDED_CODE
+        
+        row = self._evicted + len(self.ids)
+        self.ids.append(result.request_id)
+        self.scores.append(result.overall_risk_score)
+        self.status.append(STATUS_CODES[result.status])
+        self.proc_time.append(result.processing_time)
+        self.completed_ts.append(now)
+        self.results[result.request_id] = (now, result, row)
+    
+    def evict_expired(self, now: Optional[float] = None):
+        """Remove rows completed more than retention_seconds ago"""
+        cutoff = (now if now is not None else time.time()) - self.retention_seconds
+        count = bisect_left(self.completed_ts, cutoff)
+        if not count:
+            return
+        
+        for request_id in self.ids[:count]:
+            # A re-processed request keeps its newer result
+            entry = self.results.get(request_id)
+            if entry and entry[0] < cutoff:
+                del self.results[request_id]
+        
+        del self.ids[:count]
+        del self.scores[:count]
+        del self.status[:count]
+        del self.proc_time[:count]
+        del self.completed_ts[:count]
+        self._evicted += count
+    
+    def __len__(self) -> int:
+        return len(self.results)
+    
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self.results
+    
+    def __getitem__(self, request_id: str) -> 'BackgroundCheckResult':
+        return self.results[request_id][1]
+
+def _dumps_report(report_data: Dict) -> bytes:
+    """Serialize a report to a single line of JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(report_data)
+    return json.dumps(report_data).encode('utf-8')
+
+# Report writes from concurrent completions are batched together
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_BATCH_WINDOW = 0.0001  # seconds to let concurrent completions join a batch
+DEFAULT_QUEUE_SIZE = 1024
+
+# Reports are appended as NDJSON to numbered segment files, rotated by size
+REPORT_SEGMENT_PATTERN = re.compile(r"^reports-(\d+)\.ndjson$")
+REPORT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+REPORT_FILE_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+# System status is rebuilt at most this often; polls in between get the cached dict
+STATUS_CACHE_TTL = 0.1  # seconds
+
+class ReportWriter:
+    """
+    Background writer for final reports
+    Appends queued reports to an NDJSON segment log in batches; each caller
+    gets its report's location once the batch holding it has been written
+    """
+    
+    def __init__(self, directory: str, batch_size: int = DEFAULT_BATCH_SIZE, batch_window: float = DEFAULT_BATCH_WINDOW,
+                 segment_max_bytes: int = REPORT_SEGMENT_MAX_BYTES):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.segment_max_bytes = segment_max_bytes
+        self._queue = None
+        self._task = None
+        self._dir_fd = None
+        self._segment = 0
+        self._offset = 0
+        self._fd = None
+        self._fd_segment = None
+    
+    @staticmethod
+    def segment_name(segment: int) -> str:
+        return f"reports-{segment:06d}.ndjson"
+    
+    def start(self):
+        """Resume the newest segment and start the writer task on the running event loop"""
+        # Files are opened relative to a held directory fd where the platform allows it
+        if os.open in os.supports_dir_fd:
+            self._dir_fd = os.open(self.directory, os.O_RDONLY)
+        
+        segments = [int(m.group(1)) for m in map(REPORT_SEGMENT_PATTERN.match, os.listdir(self.directory)) if m]
+        self._segment = max(segments, default=1)
+        try:
+            self._offset = os.path.getsize(os.path.join(self.directory, self.segment_name(self._segment)))
+        except FileNotFoundError:
+            self._offset = 0
+        
+        self._queue = asyncio.Queue(DEFAULT_QUEUE_SIZE)
+        self._task = asyncio.ensure_future(self._run())
+    
+    async def enqueue(self, data: bytes) -> str:
+        """Queue a serialized report and return its segment#offset location once it is written
+        Raises the write error if the report could not be written"""
+        written = asyncio.get_running_loop().create_future()
+        await self._queue.put((data + b"\n", written))
+        return await written
+    
+    async def close(self):
+        """Flush every queued report and stop the writer task"""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._fd_segment = None
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+            self._dir_fd = None
+    
+    async def _run(self):
+        """Collect up to batch_size reports per pass and write them together"""
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            await asyncio.sleep(self.batch_window)
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            # File writes block, so they run on the default executor
+            outcomes = await asyncio.get_running_loop().run_in_executor(
+                None, self._write_batch, [line for line, _ in batch]
+            )
+            for (_, written), outcome in zip(batch, outcomes):
+                if written.done():
+                    continue  # the caller was cancelled
+                if isinstance(outcome, Exception):
+                    written.set_exception(outcome)
+                else:
+                    written.set_result(outcome)
+    
+    def _write_batch(self, lines: List[bytes]) -> List[Any]:
+        """Append a batch of report lines, rotating segments by size (runs in an executor thread)
+        Returns each line's segment#offset location, or the exception that kept it from being written"""
+        outcomes = []
+        start = 0
+        while start < len(lines):
+            # Start a new segment when the next line would push a non-empty one past its limit
+            if self._offset and self._offset + len(lines[start]) > self.segment_max_bytes:
+                self._segment += 1
+                self._offset = 0
+            
+            # One write per run of lines that fit in the current segment
+            end = start + 1
+            size = self._offset + len(lines[start])
+            while end < len(lines) and size + len(lines[end]) <= self.segment_max_bytes:
+                size += len(lines[end])
+                end += 1
+            
+            try:
+                offset = self._write_segment(self._segment, b"".join(lines[start:end]))
+            except Exception as e:
+                logger.error(f"Failed to write {end - start} reports to {self.segment_name(self._segment)}: {e}")
+                outcomes.extend([e] * (end - start))
+            else:
+                for line in lines[start:end]:
+                    outcomes.append(f"{self.segment_name(self._segment)}#{offset}")
+                    offset += len(line)
+                self._offset = offset
+            start = end
+        return outcomes
+    
+    def _write_segment(self, segment: int, data: bytes) -> int:
+        """Append data to a segment file and return the offset it was written at"""
+        if self._fd_segment != segment:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            filename = self.segment_name(segment)
+            if self._dir_fd is not None:
+                self._fd = os.open(filename, REPORT_FILE_FLAGS, 0o644, dir_fd=self._dir_fd)
+            else:
+                self._fd = os.open(os.path.join(self.directory, filename), REPORT_FILE_FLAGS, 0o644)
+            self._fd_segment = segment
+        
+        # Locations come from the file's actual end, so an earlier failed write cannot skew them
+        offset = os.fstat(self._fd).st_size
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        return offset
+
 class PropertyVetOrchestrator:
     """
     TAURUS PropertyVet™ Master Orchestrator
     Coordinates all background check agents and processes
     """
     
+    REPORT_DIR = "/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/reports"
+    
     def __init__(self):
         self.config = self._load_config()
+        self._apply_config()
         self.credit_agent = None
         self.public_records_agent = None
+        # active_requests maps request_id -> index of a reusable slot dict in the pool
         self.active_requests = {}
-        self.completed_requests = {}
+        self._active_slot_pool = [{} for _ in range(self.max_concurrent_requests)]
+        self._active_free = list(range(len(self._active_slot_pool)))
+        self.completed_requests = RequestStore(self.data_retention_days)
+        self.report_writer = ReportWriter(self.REPORT_DIR)
+        self._log_flush_task = None
+        self._cached_status = None
+        self._cached_status_at = 0.0
         self.performance_metrics = {
             "total_requests": 0,
             "successful_requests": 0,
@@ -128,6 +518,26 @@ class PropertyVetOrchestrator:
             }
         }
     
+    def _apply_config(self):
+        """Copy the config values used per request onto the instance"""
+        weights = self.config["scoring"]
+        thresholds = self.config["thresholds"]
+        
+        self.max_concurrent_requests = self.config["processing"]["max_concurrent_requests"]
+        self.data_retention_days = self.config["compliance"]["data_retention_days"]
+        self.score_weights = (
+            weights["credit_weight"],
+            weights["public_records_weight"],
+            weights["employment_weight"],
+            weights["identity_weight"]
+        )
+        # Ascending order for score_batch's bisect
+        self.score_thresholds = (
+            thresholds["high_risk_score"],
+            thresholds["medium_risk_score"],
+            thresholds["low_risk_score"]
+        )
+    
     async def initialize(self):
         """Initialize all agents and components"""
         logger.info("Initializing PropertyVet Orchestrator...")
@@ -140,39 +550,69 @@ class PropertyVetOrchestrator:
         self.public_records_agent = PublicRecordsAgent()
         await self.public_records_agent.initialize()
         
+        # Create the reports directory once, then start the batched report writer
+        # and the periodic log flusher
+        os.makedirs(self.REPORT_DIR, exist_ok=True)
+        self.report_writer.start()
+        self._log_flush_task = asyncio.ensure_future(self._flush_logs_periodically())
+        
         logger.info("PropertyVet Orchestrator initialized successfully")
     
     async def close(self):
         """Cleanup all agents and resources"""
+        await self.report_writer.close()
         if self.credit_agent:
             await self.credit_agent.close()
         if self.public_records_agent:
             await self.public_records_agent.close()
         logger.info("PropertyVet Orchestrator closed")
+        
+        if self._log_flush_task:
+            self._log_flush_task.cancel()
+            self._log_flush_task = None
+        _flush_log_buffers()
+    
+    async def _flush_logs_periodically(self):
+        """Flush buffered log records every DEFAULT_FLUSH_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(DEFAULT_FLUSH_INTERVAL)
+            _flush_log_buffers()
     
     async def process_background_check(self, request: BackgroundCheckRequest) -> BackgroundCheckResult:
         """Process complete background check request"""
-        start_time = time.time()
-        logger.info(f"Processing background check: {request.request_id}")
+        # Every log line emitted while this request runs is tagged with its id
+        token = REQUEST_ID.set(request.request_id)
+        try:
+            return await self._process_background_check(request)
+        finally:
+            REQUEST_ID.reset(token)
+    
+    async def _process_background_check(self, request: BackgroundCheckRequest) -> BackgroundCheckResult:
+        start_time = time.perf_counter()
+        logger.info("Processing background check")
         
         # Validate request
         if not self._validate_request(request):
             raise ValueError("Invalid background check request")
         
+        # A request id already in flight keeps its one slot; the duplicate fails without touching it
+        if request.request_id in self.active_requests:
+            logger.error("Background check already in progress")
+            return self._failed_result(request, "Duplicate request: already in progress", 0.0)
+        
         # Add to active requests
-        self.active_requests[request.request_id] = {
-            "request": request,
-            "status": BackgroundCheckStatus.IN_PROGRESS,
-            "started_at": datetime.now().isoformat(),
-            "progress": {}
-        }
+        slot = self._acquire_active_slot(request.request_id)
+        slot["request"] = request
+        slot["status"] = BackgroundCheckStatus.IN_PROGRESS
+        slot["started_at"] = datetime.now().isoformat()
+        slot["progress"] = {}
         
         try:
             # Execute background check workflow
             result = await self._execute_background_check_workflow(request)
             
             # Calculate processing time
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             result.processing_time = processing_time
             result.completed_at = datetime.now().isoformat()
             
@@ -180,52 +620,109 @@ class PropertyVetOrchestrator:
             self._update_performance_metrics(True, processing_time)
             
             # Move to completed requests
-            self.completed_requests[request.request_id] = result
-            del self.active_requests[request.request_id]
+            self.completed_requests.add(result)
+            self._release_active_slot(request.request_id)
             
             # Generate final report
             await self._generate_final_report(result)
             
-            logger.info(f"Background check completed: {request.request_id} in {processing_time:.2f}s")
+            logger.info(f"Background check completed in {processing_time:.2f}s")
             return result
             
         except Exception as e:
-            logger.error(f"Background check failed: {request.request_id} - {str(e)}")
+            logger.error(f"Background check failed - {str(e)}")
+            
+            processing_time = time.perf_counter() - start_time
             
             # Update metrics
-            self._update_performance_metrics(False, time.time() - start_time)
+            self._update_performance_metrics(False, processing_time)
             
             # Create failed result
-            result = BackgroundCheckResult(
-                request_id=request.request_id,
-                status=BackgroundCheckStatus.FAILED,
-                overall_risk_score=0,
-                risk_level=RiskLevel.VERY_HIGH,
-                credit_report=None,
-                public_records=None,
-                employment_verification=None,
-                identity_verification=None,
-                recommendations=["Manual review required due to processing error"],
-                flags=[f"Processing error: {str(e)}"],
-                processing_time=time.time() - start_time,
-                completed_at=datetime.now().isoformat(),
-                report_url=None
-            )
+            result = self._failed_result(request, f"Processing error: {str(e)}", processing_time)
             
-            self.completed_requests[request.request_id] = result
-            if request.request_id in self.active_requests:
-                del self.active_requests[request.request_id]
+            self.completed_requests.add(result)
+            self._release_active_slot(request.request_id)
             
             return result
     
+    def _failed_result(self, request: BackgroundCheckRequest, flag: str, processing_time: float) -> BackgroundCheckResult:
+        """Result for a request that could not be checked"""
+        return BackgroundCheckResult(
+            request_id=request.request_id,
+            status=BackgroundCheckStatus.FAILED,
+            overall_risk_score=0,
+            risk_level=RiskLevel.VERY_HIGH,
+            credit_report=None,
+            public_records=None,
+            employment_verification=None,
+            identity_verification=None,
+            recommendations=["Manual review required due to processing error"],
+            flags=[flag],
+            processing_time=processing_time,
+            completed_at=datetime.now().isoformat(),
+            report_url=None
+        )
+    
+    def _acquire_active_slot(self, request_id: str) -> Dict:
+        """Take a free slot from the pool and register it for request_id"""
+        if not self._active_free:
+            # Direct callers can exceed max_concurrent_requests; grow the pool
+            self._active_slot_pool.append({})
+            self._active_free.append(len(self._active_slot_pool) - 1)
+        
+        index = self._active_free.pop()
+        self.active_requests[request_id] = index
+        return self._active_slot_pool[index]
+    
+    def _release_active_slot(self, request_id: str):
+        """Clear the request's slot and return it to the pool"""
+        index = self.active_requests.pop(request_id, None)
+        if index is not None:
+            self._active_slot_pool[index].clear()
+            self._active_free.append(index)
+    
+    async def process_batch(self, requests: List[BackgroundCheckRequest]) -> List[BackgroundCheckResult]:
+        """Process a batch of background checks with bounded concurrency"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        results: List[Optional[BackgroundCheckResult]] = [None] * len(requests)
+        tasks = []
+        
+        try:
+            # Acquire before creating each task so only max_concurrent_requests exist at once
+            for i, request in enumerate(requests):
+                # An invalid request fails on its own instead of aborting the whole batch
+                token = REQUEST_ID.set(request.request_id)
+                try:
+                    valid = self._validate_request(request)
+                finally:
+                    REQUEST_ID.reset(token)
+                if not valid:
+                    results[i] = self._failed_result(request, "Invalid background check request", 0.0)
+                    continue
+                
+                await semaphore.acquire()
+                task = asyncio.ensure_future(self.process_background_check(request))
+                task.add_done_callback(lambda _: semaphore.release())
+                tasks.append((i, task))
+            
+            completed = await asyncio.gather(*[task for _, task in tasks])
+            for (i, _), result in zip(tasks, completed):
+                results[i] = result
+            return results
+        
+        except BaseException:
+            for _, task in tasks:
+                task.cancel()
+            raise
+
     def _validate_request(self, request: BackgroundCheckRequest) -> bool:
         """Validate background check request"""
-        required_fields = ["request_id", "applicant_name", "ssn", "date_of_birth", "address"]
-        
-        for field in required_fields:
-            if not getattr(request, field, None):
-                logger.error(f"Missing required field: {field}")
-                return False
+        values = _get_required_fields(request)
+        if not all(values):
+            # Only look up which field is missing on the failure path
+            missing = next(name for name, value in zip(REQUIRED_FIELDS, values) if not value)
+            logger.error(f"Missing required field: {missing}")
+            return False
         
         if not request.consent_provided:
             logger.error("Consent not provided")
@@ -253,16 +750,26 @@ class PropertyVetOrchestrator:
             report_url=None
         )
         
-        # Execute checks based on level
+        # Select checks based on level; they are independent, so run them concurrently
+        checks = []
         if request.check_level in ["standard", "premium"]:
-            await self._execute_credit_check(request, result)
+            checks.append(("credit_report", "Credit check", self._execute_credit_check(request)))
         
         if request.check_level in ["basic", "standard", "premium"]:
-            await self._execute_public_records_check(request, result)
+            checks.append(("public_records", "Public records check", self._execute_public_records_check(request)))
         
         if request.check_level == "premium":
-            await self._execute_employment_verification(request, result)
-            await self._execute_identity_verification(request, result)
+            checks.append(("employment_verification", "Employment verification", self._execute_employment_verification(request)))
+            checks.append(("identity_verification", "Identity verification", self._execute_identity_verification(request)))
+        
+        outcomes = await asyncio.gather(*(check for _, _, check in checks), return_exceptions=True)
+        
+        for (field, label, _), outcome in zip(checks, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"{label} failed: {str(outcome)}")
+                result.flags.append(f"{label} failed: {str(outcome)}")
+            else:
+                setattr(result, field, outcome)
         
         # Calculate overall risk score
         self._calculate_overall_risk_score(result)
@@ -275,94 +782,80 @@ class PropertyVetOrchestrator:
         
         return result
     
-    async def _execute_credit_check(self, request: BackgroundCheckRequest, result: BackgroundCheckResult):
-        """Execute credit check"""
-        logger.info(f"Executing credit check for {request.request_id}")
+    async def _execute_credit_check(self, request: BackgroundCheckRequest) -> Dict:
+        """Execute credit check and return the credit summary"""
+        logger.info("Executing credit check")
+        
+        # Create credit check request
+        credit_request = CreditCheckRequest(
+            ssn=request.ssn,
+            first_name=request.first_name,
+            last_name=request.last_name,
+            date_of_birth=request.date_of_birth,
+            address=request.address,
+            city=request.city,
+            state=request.state,
+            zip_code=request.zip_code,
+            request_id=request.request_id,
+            bureau=CreditBureauProvider.EQUIFAX
+        )
         
-        try:
-            # Create credit check request
-            credit_request = CreditCheckRequest(
-                ssn=request.ssn,
-                first_name=request.applicant_name.split()[0],
-                last_name=request.applicant_name.split()[-1],
-                date_of_birth=request.date_of_birth,
-                address=request.address,
-                city=request.city,
-                state=request.state,
-                zip_code=request.zip_code,
-                request_id=request.request_id,
-                bureau=CreditBureauProvider.EQUIFAX
-            )
-            
-            # Execute credit check
-            credit_report = await self.credit_agent.perform_credit_check(credit_request)
-            
-            # Store result
-            result.credit_report = {
-                "score": credit_report.credit_score.score,
-                "grade": credit_report.credit_score.grade,
-                "risk_level": credit_report.risk_level,
-                "recommendations": credit_report.recommendations,
-                "alerts": credit_report.alerts
-            }
-            
-            logger.info(f"Credit check completed for {request.request_id}")
-            
-        except Exception as e:
-            logger.error(f"Credit check failed for {request.request_id}: {str(e)}")
-            result.flags.append(f"Credit check failed: {str(e)}")
+        # Execute credit check
+        credit_report = await self.credit_agent.perform_credit_check(credit_request)
+        
+        logger.info("Credit check completed")
+        return {
+            "score": credit_report.credit_score.score,
+            "grade": credit_report.credit_score.grade,
+            "risk_level": credit_report.risk_level,
+            "recommendations": credit_report.recommendations,
+            "alerts": credit_report.alerts
+        }
     
-    async def _execute_public_records_check(self, request: BackgroundCheckRequest, result: BackgroundCheckResult):
-        """Execute public records check"""
-        logger.info(f"Executing public records check for {request.request_id}")
+    async def _execute_public_records_check(self, request: BackgroundCheckRequest) -> Dict:
+        """Execute public records check and return the records summary"""
+        logger.info("Executing public records check")
+        
+        # Create public records request
+        records_request = PublicRecordsRequest(
+            first_name=request.first_name,
+            last_name=request.last_name,
+            address=request.address,
+            city=request.city,
+            state=request.state,
+            zip_code=request.zip_code,
+            date_of_birth=request.date_of_birth,
+            request_id=request.request_id
+        )
         
-        try:
-            # Create public records request
-            records_request = PublicRecordsRequest(
-                first_name=request.applicant_name.split()[0],
-                last_name=request.applicant_name.split()[-1],
-                address=request.address,
-                city=request.city,
-                state=request.state,
-                zip_code=request.zip_code,
-                date_of_birth=request.date_of_birth,
-                request_id=request.request_id
-            )
-            
-            # Execute public records check
-            records_report = await self.public_records_agent.search_public_records(records_request)
-            
-            # Store result
-            result.public_records = {
-                "criminal_records": records_report.criminal_records,
-                "civil_records": records_report.civil_records,
-                "property_records": records_report.property_records,
-                "business_records": records_report.business_records,
-                "risk_flags": records_report.risk_flags
-            }
-            
-            logger.info(f"Public records check completed for {request.request_id}")
-            
-        except Exception as e:
-            logger.error(f"Public records check failed for {request.request_id}: {str(e)}")
-            result.flags.append(f"Public records check failed: {str(e)}")
+        # Execute public records check
+        records_report = await self.public_records_agent.search_public_records(records_request)
+        
+        logger.info("Public records check completed")
+        return {
+            "criminal_records": records_report.criminal_records,
+            "civil_records": records_report.civil_records,
+            "property_records": records_report.property_records,
+            "business_records": records_report.business_records,
+            "risk_flags": records_report.risk_flags
+        }
     
-    async def _execute_employment_verification(self, request: BackgroundCheckRequest, result: BackgroundCheckResult):
+    async def _execute_employment_verification(self, request: BackgroundCheckRequest) -> Dict:
         """Execute employment verification (placeholder)"""
-        logger.info(f"Executing employment verification for {request.request_id}")
+        logger.info("Executing employment verification")
         
         # Placeholder for employment verification
-        result.employment_verification = {
+        return {
             "status": "PENDING_MANUAL_VERIFICATION",
             "notes": "Employment verification requires manual process"
         }
     
-    async def _execute_identity_verification(self, request: BackgroundCheckRequest, result: BackgroundCheckResult):
+    async def _execute_identity_verification(self, request: BackgroundCheckRequest) -> Dict:
         """Execute identity verification (placeholder)"""
-        logger.info(f"Executing identity verification for {request.request_id}")
+        logger.info("Executing identity verification")
         
         # Placeholder for identity verification
-        result.identity_verification = {
+        return {
             "status": "VERIFIED",
             "confidence": "HIGH",
             "method": "SSN_VALIDATION"
@@ -370,84 +863,56 @@ class PropertyVetOrchestrator:
     
     def _calculate_overall_risk_score(self, result: BackgroundCheckResult):
         """Calculate overall risk score"""
-        weights = self.config["scoring"]
-        total_score = 0
-        total_weight = 0
-        
-        # Credit score component
-        if result.credit_report:
-            credit_score = result.credit_report.get("score", 0)
-            total_score += credit_score * weights["credit_weight"]
-            total_weight += weights["credit_weight"]
-        
-        # Public records component (inverse scoring - fewer records = higher score)
-        if result.public_records:
-            criminal_count = len(result.public_records.get("criminal_records", []))
-            civil_count = len(result.public_records.get("civil_records", []))
-            
-            # Convert record counts to score (0-850 scale)
-            records_score = max(0, 850 - (criminal_count * 200) - (civil_count * 50))
-            total_score += records_score * weights["public_records_weight"]
-            total_weight += weights["public_records_weight"]
-        
-        # Employment verification component
-        if result.employment_verification:
-            employment_score = 700  # Default for verified employment
-            total_score += employment_score * weights["employment_weight"]
-            total_weight += weights["employment_weight"]
-        
-        # Identity verification component
-        if result.identity_verification:
-            identity_score = 800  # Default for verified identity
-            total_score += identity_score * weights["identity_weight"]
-            total_weight += weights["identity_weight"]
-        
-        # Calculate weighted average
-        if total_weight > 0:
-            result.overall_risk_score = int(total_score / total_weight)
-        else:
-            result.overall_risk_score = 0
+        out_scores = [0]
+        out_levels = [0]
+        columns = [[value] for value in self._score_inputs(result)]
+        score_batch(*columns, self.score_weights, self.score_thresholds, out_scores, out_levels)
         
-        # Determine risk level
-        thresholds = self.config["thresholds"]
-        if result.overall_risk_score >= thresholds["low_risk_score"]:
-            result.risk_level = RiskLevel.LOW
-        elif result.overall_risk_score >= thresholds["medium_risk_score"]:
-            result.risk_level = RiskLevel.MEDIUM
-        elif result.overall_risk_score >= thresholds["high_risk_score"]:
-            result.risk_level = RiskLevel.HIGH
-        else:
-            result.risk_level = RiskLevel.VERY_HIGH
+        result.overall_risk_score = out_scores[0]
+        result.risk_level = RISK_LEVELS_BY_CODE[out_levels[0]]
+    
+    def score_all_completed(self) -> int:
+        """Re-score every completed result in one batch (e.g. after a scoring config change)"""
+        self._apply_config()
+        store = self.completed_requests
+        completed = STATUS_CODES[BackgroundCheckStatus.COMPLETED]
+        rows = [i for i, code in enumerate(store.status) if code == completed]
+        results = [store[store.ids[i]] for i in rows]
+        if not results:
+            return 0
+        
+        columns = list(zip(*(self._score_inputs(result) for result in results)))
+        out_scores = [0] * len(results)
+        out_levels = [0] * len(results)
+        score_batch(*columns, self.score_weights, self.score_thresholds, out_scores, out_levels)
+        
+        for i, result, score, level in zip(rows, results, out_scores, out_levels):
+            result.overall_risk_score = score
+            result.risk_level = RISK_LEVELS_BY_CODE[level]
+            self._generate_recommendations(result)
+            store.scores[i] = score
+        
+        logger.info(f"Re-scored {len(results)} completed background checks")
+        return len(results)
+    
+    def _score_inputs(self, result: BackgroundCheckResult) -> tuple:
+        """Extract the score_batch input row for a result"""
+        credit_report = result.credit_report
+        public_records = result.public_records
+        return (
+            credit_report.get("score", 0) if credit_report else 0,
+            bool(credit_report),
+            len(public_records.get("criminal_records", [])) if public_records else 0,
+            len(public_records.get("civil_records", [])) if public_records else 0,
+            bool(public_records),
+            bool(result.employment_verification),
+            bool(result.identity_verification)
+        )
     
     def _generate_recommendations(self, result: BackgroundCheckResult):
         """Generate recommendations based on results"""
-        recommendations = []
-        
         # Risk level based recommendations
-        if result.risk_level == RiskLevel.LOW:
-            recommendations.extend([
-                "Excellent candidate - approve with standard terms",
-                "Minimal security deposit required",
-                "Standard lease terms recommended"
-            ])
-        elif result.risk_level == RiskLevel.MEDIUM:
-            recommendations.extend([
-                "Good candidate - approve with standard terms",
-                "Standard security deposit recommended",
-                "Consider rental insurance requirement"
-            ])
-        elif result.risk_level == RiskLevel.HIGH:
-            recommendations.extend([
-                "Moderate risk - consider additional security measures",
-                "Increased security deposit recommended",
-                "Shorter lease term or co-signer suggested"
-            ])
-        else:  # VERY_HIGH
-            recommendations.extend([
-                "High risk - manual review recommended",
-                "Consider declining or requiring co-signer",
-                "Additional documentation and verification needed"
-            ])
+        recommendations = list(RISK_RECOMMENDATIONS[result.risk_level])
         
         # Specific recommendations based on findings
         if result.credit_report and result.credit_report.get("score", 0) < 600:
@@ -462,7 +927,7 @@ class PropertyVetOrchestrator:
         """Generate final PDF/HTML report"""
         report_data = {
             "request_id": result.request_id,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": result.completed_at,
             "overall_risk_score": result.overall_risk_score,
             "risk_level": result.risk_level.value,
             "credit_summary": result.credit_report,
@@ -472,15 +937,17 @@ class PropertyVetOrchestrator:
             "processing_time": result.processing_time
         }
         
-        # Store report
-        report_path = f"/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/reports/{result.request_id}_report.json"
-        
-        os.makedirs(os.path.dirname(report_path), exist_ok=True)
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        # Append to the report log; the URL points at the line's segment and byte offset
+        try:
+            location = await self.report_writer.enqueue(_dumps_report(report_data))
+        except Exception as e:
+            # The result stands without a report; no URL is handed out for a report that was not written
+            logger.error(f"Final report could not be written: {str(e)}")
+            return
+        report_path = f"{self.REPORT_DIR}/{location}"
         
         result.report_url = report_path
-        logger.info(f"Final report generated: {report_path}")
+        logger.info(f"Final report written: {report_path}")
     
     def _update_performance_metrics(self, success: bool, processing_time: float):
         """Update performance metrics"""
@@ -500,25 +967,32 @@ class PropertyVetOrchestrator:
     
     def get_system_status(self) -> Dict:
         """Get current system status"""
-        return {
+        # Callers get their own copy, so changing it cannot alter the cached status or live metrics
+        now = time.monotonic()
+        if self._cached_status is not None and now - self._cached_status_at < STATUS_CACHE_TTL:
+            return copy.deepcopy(self._cached_status)
+        
+        self._cached_status = {
             "status": "OPERATIONAL",
             "version": "1.0.0",
             "active_requests": len(self.active_requests),
             "completed_requests": len(self.completed_requests),
-            "performance_metrics": self.performance_metrics,
+            "performance_metrics": dict(self.performance_metrics),
             "agents": {
                 "credit_bureau": self.credit_agent.get_agent_status() if self.credit_agent else None,
                 "public_records": self.public_records_agent.get_agent_status() if self.public_records_agent else None
             },
             "last_updated": datetime.now().isoformat()
         }
+        self._cached_status_at = now
+        return copy.deepcopy(self._cached_status)
     
     async def get_request_status(self, request_id: str) -> Dict:
         """Get status of specific request"""
         if request_id in self.active_requests:
             return {
                 "status": "IN_PROGRESS",
-                "details": self.active_requests[request_id]
+                "details": dict(self._active_slot_pool[self.active_requests[request_id]])
             }
         elif request_id in self.completed_requests:
             return {
@@ -530,46 +1004,3 @@ class PropertyVetOrchestrator:
                 "status": "NOT_FOUND",
                 "message": f"Request {request_id} not found"
             }
-
-# Test function
-async def test_orchestrator():
-    """Test the PropertyVet Orchestrator"""
-    orchestrator = PropertyVetOrchestrator()
-    await orchestrator.initialize()
-    
-    # Test request
-    test_request = BackgroundCheckRequest(
-        request_id="TEST_ORCHESTRATOR_001",
-        applicant_name="Sarah Johnson",
-        ssn="123-45-6789",
-        date_of_birth="1990-05-15",
-        address="123 Maple Street",
-        city="Atlanta",
-        state="GA",
-        zip_code="30309",
-        phone="555-123-4567",
-        email="sarah.johnson@email.com",
-        property_address="456 Oak Avenue, Unit 205",
-        landlord_id="LANDLORD_001",
-        check_level="standard",
-        consent_provided=True,
-        created_at=datetime.now().isoformat()
-    )
-    
-    try:
-        # Get system status
-        status = orchestrator.get_system_status()
-        print("System Status:")
-        print(json.dumps(status, indent=2))
-        
-        # This would normally process a real background check
-        # For testing, we just show the orchestrator is ready
-        print("\nPropertyVet Orchestrator is ready for production!")
-        
-    except Exception as e:
-        logger.error(f"Test failed: {e}")
-    finally:
-        await orchestrator.close()
-
-if __name__ == "__main__":
-    asyncio.run(test_orchestrator())
\ No newline at end of file
@@ -0,0 +1 @@
+"""PropertyVet MCP agents (installed as propertyvet.mcp)"""
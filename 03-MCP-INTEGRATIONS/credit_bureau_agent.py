@@ -10,14 +10,27 @@ import json
 import logging
 import os
 import time
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import aiohttp
 import hashlib
-import hmac
 import base64
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
+from json.encoder import encode_basestring as _json_string
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the stdlib event loop is used without it
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +43,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _dumps(data: Any) -> bytes:
+    """Serialize to compact JSON bytes; nested dataclasses are serialized as objects"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), default=asdict).encode('utf-8')
+
+def _json_value(value: Any) -> str:
+    """JSON text for one payload field; strings take the fast escaping path, numbers and None encode as usual"""
+    if isinstance(value, str):
+        return _json_string(value)
+    return json.dumps(value)
+
+# Credit bureau config file, parsed once per process and shared by every agent
+CREDIT_BUREAU_CONFIG_PATH = "/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/02-CONFIGS/credit_bureau_config.json"
+_config_file_cache: Dict[str, Optional[Dict]] = {}
+
+def _read_config_file(path: str) -> Optional[Dict]:
+    """Parse a JSON config file on first use; None when the file does not exist"""
+    if path not in _config_file_cache:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            _config_file_cache[path] = None
+        else:
+            _config_file_cache[path] = orjson.loads(data) if orjson is not None else json.loads(data)
+    return _config_file_cache[path]
+
 class CreditBureauProvider(Enum):
     EQUIFAX = "equifax"
     TRANSUNION = "transunion"
@@ -69,10 +110,232 @@ class CreditReport:
     inquiries: List[Dict]
     public_records: List[Dict]
     alerts: List[Dict]
-    recommendations: List[str]
+    recommendations: Sequence[str]
     risk_level: str
     verification_status: str
 
+# Risk level by credit score: a score at a cut-off belongs to the level above it
+RISK_SCORE_THRESHOLDS = (550, 650, 750)
+RISK_LEVELS = ("VERY_HIGH", "HIGH", "MEDIUM", "LOW")
+
+# Shared, immutable recommendations for scores below 600, below 700 and 700 or above
+RECOMMENDATION_SCORE_THRESHOLDS = (600, 700)
+SCORE_RECOMMENDATIONS = (
+    (
+        "Consider requiring a co-signer or additional security deposit",
+        "Implement stricter income verification requirements",
+        "Consider shorter lease terms with regular reviews"
+    ),
+    (
+        "Standard security deposit recommended",
+        "Verify employment and income thoroughly",
+        "Consider rental insurance requirement"
+    ),
+    (
+        "Low risk tenant - standard lease terms acceptable",
+        "Minimal security deposit required",
+        "Excellent rental history expected"
+    )
+)
+
+# Bureau request payloads as JSON templates; every %s is filled with a JSON-encoded value
+EQUIFAX_PAYLOAD_TEMPLATE = (
+    '{"memberNumber":%s,"consumer":{"ssn":%s,"firstName":%s,"lastName":%s,"dateOfBirth":%s,'
+    '"address":{"street":%s,"city":%s,"state":%s,"zipCode":%s}},'
+    '"requestId":%s,"productCode":"CREDIT_PROFILE"}'
+)
+TRANSUNION_PAYLOAD_TEMPLATE = (
+    '{"subscriberId":%s,"subject":{"ssn":%s,"name":{"first":%s,"last":%s},"dateOfBirth":%s,'
+    '"currentAddress":{"line1":%s,"city":%s,"state":%s,"postalCode":%s}},'
+    '"requestId":%s,"product":"CREDIT_REPORT"}'
+)
+EXPERIAN_PAYLOAD_TEMPLATE = (
+    '{"subcode":%s,"consumer":{"ssn":%s,"firstName":%s,"lastName":%s,"dob":%s,'
+    '"addresses":[{"line1":%s,"city":%s,"state":%s,"zip":%s}]},'
+    '"options":{"includeScore":true,"includeFactors":true}}'
+)
+
+# Per-bureau rate limit state is kept in parallel arrays indexed by BUREAU_INDEX
+BUREAU_INDEX = {bureau: i for i, bureau in enumerate(CreditBureauProvider)}
+RATE_LIMIT_PER_MINUTE = array('I', [60, 100, 80])  # equifax, transunion, experian
+RATE_LIMIT_WINDOW = 60.0  # seconds
+
+# One pooled keep-alive session serves every bureau host
+HTTP_POOL_LIMIT = 64
+HTTP_POOL_LIMIT_PER_HOST = 32
+HTTP_KEEPALIVE_TIMEOUT = 60  # seconds
+HTTP_DNS_CACHE_TTL = 300  # seconds
+
+# Recent reports are served from memory so retries do not re-pull the bureau
+REPORT_CACHE_SIZE = 4096
+REPORT_CACHE_TTL = 300  # seconds
+
+class TTLCache:
+    """Small LRU cache whose entries expire ttl seconds after they are set"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+        
+    def set(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            
+    def __len__(self) -> int:
+        return len(self._data)
+
+# HMAC-SHA256 with the key schedule precomputed once per bureau
+HMAC_BLOCK_SIZE = 64  # SHA-256 block size in bytes
+HMAC_IPAD = bytes(b ^ 0x36 for b in range(256))
+HMAC_OPAD = bytes(b ^ 0x5c for b in range(256))
+
+def _hmac_sha256_states(key: bytes) -> tuple:
+    """Return SHA-256 states primed with the HMAC inner and outer padded keys"""
+    if len(key) > HMAC_BLOCK_SIZE:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(HMAC_BLOCK_SIZE, b"\0")
+    return hashlib.sha256(key.translate(HMAC_IPAD)), hashlib.sha256(key.translate(HMAC_OPAD))
+
+# Audit entries are appended as JSON Lines to one file per UTC hour and flushed in batches
+AUDIT_LOG_DIR = "/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/audit_log"
+AUDIT_FLUSH_INTERVAL = 0.05  # seconds
+AUDIT_FLUSH_BYTES = 64 * 1024
+AUDIT_BUCKET_SECONDS = 3600
+AUDIT_RECENT_BUCKETS = 24
+AUDIT_FILE_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+# Stored credit reports, one JSON file per request; created once in initialize()
+CREDIT_REPORTS_DIR = "/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/credit_reports"
+
+# Audit and storage writes are queued to a background writer so checks return right after parsing
+WRITE_QUEUE_SIZE = 1024
+WRITE_BATCH_SIZE = 64
+
+class AsyncAuditWriter:
+    """
+    Append-only JSON Lines audit writer
+    Buffers entries in memory and appends them with one write per flush,
+    rotating to a new bucket file every hour
+    """
+    
+    def __init__(self, directory: str, flush_interval: float = AUDIT_FLUSH_INTERVAL, flush_bytes: int = AUDIT_FLUSH_BYTES):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.recent_buckets = deque(maxlen=AUDIT_RECENT_BUCKETS)
+        self._bucket = None
+        self._buffer = bytearray()
+        self._pending = []
+        self._fd = None
+        self._fd_bucket = None
+        self._task = None
+        self._wake = None
+        self._closing = False
+        
+    @staticmethod
+    def bucket_name(bucket: int) -> str:
+        return time.strftime("%Y%m%d%H.jsonl", time.gmtime(bucket * AUDIT_BUCKET_SECONDS))
+        
+    def start(self):
+        """Start the flush task on the running event loop"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.recent_buckets.extend(sorted(name for name in os.listdir(self.directory) if name.endswith(".jsonl")))
+        self._wake = asyncio.Event()
+        self._closing = False
+        self._task = asyncio.ensure_future(self._run())
+        
+    def append(self, entry: Dict):
+        """Buffer one audit entry; never touches the disk"""
+        bucket = int(time.time()) // AUDIT_BUCKET_SECONDS
+        if bucket != self._bucket:
+            # Hour rolled over: park what belongs to the previous bucket
+            if self._buffer:
+                self._pending.append((self._bucket, bytes(self._buffer)))
+                self._buffer.clear()
+            self._bucket = bucket
+            name = self.bucket_name(bucket)
+            if name not in self.recent_buckets:
+                self.recent_buckets.append(name)
+        
+        self._buffer += _dumps(entry) + b"\n"
+        if self._wake is not None and len(self._buffer) >= self.flush_bytes:
+            self._wake.set()
+            
+    def iter_recent_entries(self):
+        """Stream entries from the recent bucket files, oldest first"""
+        for name in list(self.recent_buckets):
+            try:
+                with open(os.path.join(self.directory, name), 'rb') as f:
+                    for line in f:
+                        yield json.loads(line)
+            except FileNotFoundError:
+                continue
+            
+    async def close(self):
+        """Flush buffered entries and close the audit file"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wake.set()
+        await self._task
+        self._task = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._fd_bucket = None
+        
+    async def _run(self):
+        """Flush every flush_interval, or sooner once flush_bytes are buffered"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            
+            chunks = self._pending
+            self._pending = []
+            if self._buffer:
+                chunks.append((self._bucket, bytes(self._buffer)))
+                self._buffer.clear()
+            if chunks:
+                # The writes block, so they run on the default executor
+                await asyncio.get_running_loop().run_in_executor(None, self._write, chunks)
+                
+            if self._closing and not self._buffer and not self._pending:
+                return
+                
+    def _write(self, chunks: List[tuple]):
+        for bucket, data in chunks:
+            try:
+                if bucket != self._fd_bucket:
+                    if self._fd is not None:
+                        os.close(self._fd)
+                        self._fd = None
+                    self._fd = os.open(os.path.join(self.directory, self.bucket_name(bucket)), AUDIT_FILE_FLAGS, 0o644)
+                    self._fd_bucket = bucket
+                
+                view = memoryview(data)
+                while view:
+                    written = os.write(self._fd, view)
+                    view = view[written:]
+            except Exception as e:
+                logger.error(f"Failed to write audit log: {e}")
+
 class CreditBureauAgent:
     """
     TAURUS PropertyVet™ Credit Bureau Agent
@@ -83,16 +346,33 @@ class CreditBureauAgent:
         self.config = self._load_config()
         self.session = None
         self.request_count = 0
-        self.rate_limits = {
-            CreditBureauProvider.EQUIFAX: {"max_per_minute": 60, "current": 0, "reset_time": time.time()},
-            CreditBureauProvider.TRANSUNION: {"max_per_minute": 100, "current": 0, "reset_time": time.time()},
-            CreditBureauProvider.EXPERIAN: {"max_per_minute": 80, "current": 0, "reset_time": time.time()}
+        # Sliding one-minute window per bureau: monotonic timestamps of the requests sent in the last 60s
+        self._rl_windows = [deque() for _ in CreditBureauProvider]
+        # Monotonic time a slot frees up for bureaus that refused on rate limit
+        self._rl_limited_until = array('d', [0.0] * len(CreditBureauProvider))
+        self.audit_writer = AsyncAuditWriter(AUDIT_LOG_DIR)
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Per-agent secret for consumer keys, so the SSNs behind cached keys cannot be brute-forced
+        self._key_salt = os.urandom(16)
+        # Credit pulls currently in flight, keyed by consumer + bureau; each runs in its own task
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+        # Callers currently awaiting each in-flight pull
+        self._inflight_waiters: Dict[bytes, int] = {}
+        self._report_cache = TTLCache(REPORT_CACHE_SIZE, REPORT_CACHE_TTL)
+        self.cache_hits = 0
+        self._payload_builders = {
+            CreditBureauProvider.EQUIFAX: self._build_equifax_payload,
+            CreditBureauProvider.TRANSUNION: self._build_transunion_payload,
+            CreditBureauProvider.EXPERIAN: self._build_experian_payload
+        }
+        self._hmac_states = {
+            bureau: _hmac_sha256_states(self.config[bureau.value]["secret_key"].encode('utf-8'))
+            for bureau in CreditBureauProvider
         }
         
     def _load_config(self) -> Dict:
         """Load configuration from environment and config files"""
-        config_path = "/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/02-CONFIGS/credit_bureau_config.json"
-        
         default_config = {
             "equifax": {
                 "api_url": "https://api.equifax.com/business/credit/v1",
@@ -131,13 +411,13 @@ class CreditBureauAgent:
         }
         
         try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    # Merge with defaults
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
+            loaded = _read_config_file(CREDIT_BUREAU_CONFIG_PATH)
+            if loaded is not None:
+                # Copy each section so agents never share mutable config, then merge with defaults
+                config = {key: dict(value) if isinstance(value, dict) else value for key, value in loaded.items()}
+                for key, value in default_config.items():
+                    if key not in config:
+                        config[key] = value
                 return config
         except Exception as e:
             logger.warning(f"Could not load config file: {e}, using defaults")
@@ -146,123 +426,117 @@ class CreditBureauAgent:
     
     async def initialize(self):
         """Initialize the credit bureau agent"""
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=30),
             headers={
                 "User-Agent": "TAURUS-PropertyVet/1.0",
                 "Content-Type": "application/json"
             }
         )
+        os.makedirs(CREDIT_REPORTS_DIR, exist_ok=True)
+        self.audit_writer.start()
+        self._write_queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_task = asyncio.ensure_future(self._writer_loop())
         logger.info("Credit Bureau Agent initialized successfully")
         
     async def close(self):
         """Close the agent and cleanup resources"""
+        if self._writer_task:
+            await self._write_queue.put(None)
+            await self._writer_task
+            self._writer_task = None
+        await self.audit_writer.close()
         if self.session:
             await self.session.close()
         logger.info("Credit Bureau Agent closed")
         
-    def _generate_request_signature(self, bureau: CreditBureauProvider, request_data: str, timestamp: str) -> str:
+    def _generate_request_signature(self, bureau: CreditBureauProvider, request_data: bytes, timestamp: str) -> str:
         """Generate HMAC signature for API authentication"""
-        secret_key = self.config[bureau.value]["secret_key"]
-        message = f"{timestamp}:{request_data}"
-        signature = hmac.new(
-            secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
-        return base64.b64encode(signature).decode('utf-8')
+        # Feed "timestamp:body" straight into a copy of the primed state instead of concatenating the body
+        inner_state, outer_state = self._hmac_states[bureau]
+        inner = inner_state.copy()
+        inner.update(timestamp.encode('utf-8'))
+        inner.update(b":")
+        inner.update(request_data)
+        outer = outer_state.copy()
+        outer.update(inner.digest())
+        return base64.b64encode(outer.digest()).decode('utf-8')
+    
+    def sign_batch(self, bureau: CreditBureauProvider, requests: List[Tuple[str, bytes]]) -> List[str]:
+        """Sign several (timestamp, request body) pairs exactly as _generate_request_signature does"""
+        return [self._generate_request_signature(bureau, body, timestamp) for timestamp, body in requests]
     
     def _check_rate_limit(self, bureau: CreditBureauProvider) -> bool:
         """Check if request is within rate limits"""
-        current_time = time.time()
-        rate_limit = self.rate_limits[bureau]
+        now = time.monotonic()
+        index = BUREAU_INDEX[bureau]
+        timestamps = self._rl_windows[index]
         
-        # Reset counter if minute has passed
-        if current_time - rate_limit["reset_time"] >= 60:
-            rate_limit["current"] = 0
-            rate_limit["reset_time"] = current_time
+        # Drop requests that have left the window
+        cutoff = now - RATE_LIMIT_WINDOW
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
             
         # Check if under limit
-        if rate_limit["current"] >= rate_limit["max_per_minute"]:
+        if len(timestamps) >= RATE_LIMIT_PER_MINUTE[index]:
             return False
             
-        rate_limit["current"] += 1
+        timestamps.append(now)
         return True
     
+    @staticmethod
+    def _build_equifax_payload(request: CreditCheckRequest, config: Dict) -> bytes:
+        return (EQUIFAX_PAYLOAD_TEMPLATE % tuple(map(_json_value, (
+            config["member_number"], request.ssn, request.first_name, request.last_name,
+            request.date_of_birth, request.address, request.city, request.state,
+            request.zip_code, request.request_id
+        )))).encode('utf-8')
+    
+    @staticmethod
+    def _build_transunion_payload(request: CreditCheckRequest, config: Dict) -> bytes:
+        return (TRANSUNION_PAYLOAD_TEMPLATE % tuple(map(_json_value, (
+            config["subscriber_id"], request.ssn, request.first_name, request.last_name,
+            request.date_of_birth, request.address, request.city, request.state,
+            request.zip_code, request.request_id
+        )))).encode('utf-8')
+    
+    @staticmethod
+    def _build_experian_payload(request: CreditCheckRequest, config: Dict) -> bytes:
+        return (EXPERIAN_PAYLOAD_TEMPLATE % tuple(map(_json_value, (
+            config["subcode"], request.ssn, request.first_name, request.last_name,
+            request.date_of_birth, request.address, request.city, request.state,
+            request.zip_code
+        )))).encode('utf-8')
+    
     async def _make_credit_request(self, bureau: CreditBureauProvider, request: CreditCheckRequest) -> Dict:
         """Make credit check request to specific bureau"""
+        # Known to be limited: refuse without touching the window
+        index = BUREAU_INDEX[bureau]
+        if time.monotonic() < self._rl_limited_until[index]:
+            raise Exception(f"Rate limit exceeded for {bureau.value}")
         if not self._check_rate_limit(bureau):
+            self._rl_limited_until[index] = self._rl_windows[index][0] + RATE_LIMIT_WINDOW
             raise Exception(f"Rate limit exceeded for {bureau.value}")
             
         config = self.config[bureau.value]
         timestamp = str(int(time.time()))
         
-        # Prepare request payload based on bureau
-        if bureau == CreditBureauProvider.EQUIFAX:
-            payload = {
-                "memberNumber": config["member_number"],
-                "consumer": {
-                    "ssn": request.ssn,
-                    "firstName": request.first_name,
-                    "lastName": request.last_name,
-                    "dateOfBirth": request.date_of_birth,
-                    "address": {
-                        "street": request.address,
-                        "city": request.city,
-                        "state": request.state,
-                        "zipCode": request.zip_code
-                    }
-                },
-                "requestId": request.request_id,
-                "productCode": "CREDIT_PROFILE"
-            }
-        elif bureau == CreditBureauProvider.TRANSUNION:
-            payload = {
-                "subscriberId": config["subscriber_id"],
-                "subject": {
-                    "ssn": request.ssn,
-                    "name": {
-                        "first": request.first_name,
-                        "last": request.last_name
-                    },
-                    "dateOfBirth": request.date_of_birth,
-                    "currentAddress": {
-                        "line1": request.address,
-                        "city": request.city,
-                        "state": request.state,
-                        "postalCode": request.zip_code
-                    }
-                },
-                "requestId": request.request_id,
-                "product": "CREDIT_REPORT"
-            }
-        else:  # Experian
-            payload = {
-                "subcode": config["subcode"],
-                "consumer": {
-                    "ssn": request.ssn,
-                    "firstName": request.first_name,
-                    "lastName": request.last_name,
-                    "dob": request.date_of_birth,
-                    "addresses": [{
-                        "line1": request.address,
-                        "city": request.city,
-                        "state": request.state,
-                        "zip": request.zip_code
-                    }]
-                },
-                "options": {
-                    "includeScore": True,
-                    "includeFactors": True
-                }
-            }
+        # Serialized request payload, built by the bureau's template
+        request_bytes = self._payload_builders[bureau](request, config)
         
-        # Generate signature
-        request_json = json.dumps(payload, separators=(',', ':'))
-        signature = self._generate_request_signature(bureau, request_json, timestamp)
+        # Generate signature over the exact bytes that are sent
+        signature = self._generate_request_signature(bureau, request_bytes, timestamp)
         
         # Prepare headers
         headers = {
+            "Content-Type": "application/json",
             "Authorization": f"Bearer {config['api_key']}",
             "X-Timestamp": timestamp,
             "X-Signature": signature,
@@ -275,7 +549,7 @@ class CreditBureauAgent:
                 raise RuntimeError("HTTP session is not initialized")
             async with self.session.post(
                 f"{config['api_url']}/creditcheck",
-                json=payload,
+                data=request_bytes,
                 headers=headers,
                 timeout=config["timeout"]
             ) as response:
@@ -296,16 +570,16 @@ class CreditBureauAgent:
             logger.error(f"Request error for {bureau.value}: {str(e)}")
             raise
     
-    def _parse_credit_response(self, bureau: CreditBureauProvider, response_data: Dict, request_id: str) -> CreditReport:
+    def _parse_credit_response(self, bureau: CreditBureauProvider, response_data: Dict, request_id: str, now_iso: str) -> CreditReport:
         """Parse credit bureau response into standardized format"""
         if bureau == CreditBureauProvider.EQUIFAX:
-            return self._parse_equifax_response(response_data, request_id)
+            return self._parse_equifax_response(response_data, request_id, now_iso)
         elif bureau == CreditBureauProvider.TRANSUNION:
-            return self._parse_transunion_response(response_data, request_id)
+            return self._parse_transunion_response(response_data, request_id, now_iso)
         else:  # Experian
-            return self._parse_experian_response(response_data, request_id)
+            return self._parse_experian_response(response_data, request_id, now_iso)
     
-    def _parse_equifax_response(self, data: Dict, request_id: str) -> CreditReport:
+    def _parse_equifax_response(self, data: Dict, request_id: str, now_iso: str) -> CreditReport:
         """Parse Equifax response"""
         credit_score_data = data.get("creditScore", {})
         credit_score = CreditScore(
@@ -314,7 +588,7 @@ class CreditBureauAgent:
             range_max=credit_score_data.get("rangeMax", 850),
             grade=credit_score_data.get("grade", "Unknown"),
             factors=credit_score_data.get("factors", []),
-            date_generated=datetime.now().isoformat()
+            date_generated=now_iso
         )
         
         return CreditReport(
@@ -330,7 +604,7 @@ class CreditBureauAgent:
             verification_status="VERIFIED"
         )
     
-    def _parse_transunion_response(self, data: Dict, request_id: str) -> CreditReport:
+    def _parse_transunion_response(self, data: Dict, request_id: str, now_iso: str) -> CreditReport:
         """Parse TransUnion response"""
         score_data = data.get("riskModel", {}).get("score", {})
         credit_score = CreditScore(
@@ -339,7 +613,7 @@ class CreditBureauAgent:
             range_max=850,
             grade=score_data.get("grade", "Unknown"),
             factors=score_data.get("reasonCodes", []),
-            date_generated=datetime.now().isoformat()
+            date_generated=now_iso
         )
         
         return CreditReport(
@@ -355,7 +629,7 @@ class CreditBureauAgent:
             verification_status="VERIFIED"
         )
     
-    def _parse_experian_response(self, data: Dict, request_id: str) -> CreditReport:
+    def _parse_experian_response(self, data: Dict, request_id: str, now_iso: str) -> CreditReport:
         """Parse Experian response"""
         score_info = data.get("score", {})
         credit_score = CreditScore(
@@ -364,7 +638,7 @@ class CreditBureauAgent:
             range_max=score_info.get("maxRange", 850),
             grade=score_info.get("plus", {}).get("grade", "Unknown"),
             factors=score_info.get("factors", []),
-            date_generated=datetime.now().isoformat()
+            date_generated=now_iso
         )
         
         return CreditReport(
@@ -382,56 +656,88 @@ class CreditBureauAgent:
     
     def _calculate_risk_level(self, credit_score: int) -> str:
         """Calculate risk level based on credit score"""
-        if credit_score >= 750:
-            return "LOW"
-        elif credit_score >= 650:
-            return "MEDIUM"
-        elif credit_score >= 550:
-            return "HIGH"
-        else:
-            return "VERY_HIGH"
+        return RISK_LEVELS[bisect_right(RISK_SCORE_THRESHOLDS, credit_score)]
     
-    def _generate_recommendations(self, credit_score: int) -> List[str]:
+    def _generate_recommendations(self, credit_score: int) -> Sequence[str]:
         """Generate recommendations based on credit score"""
-        recommendations = []
-        
-        if credit_score < 600:
-            recommendations.extend([
-                "Consider requiring a co-signer or additional security deposit",
-                "Implement stricter income verification requirements",
-                "Consider shorter lease terms with regular reviews"
-            ])
-        elif credit_score < 700:
-            recommendations.extend([
-                "Standard security deposit recommended",
-                "Verify employment and income thoroughly",
-                "Consider rental insurance requirement"
-            ])
-        else:
-            recommendations.extend([
-                "Low risk tenant - standard lease terms acceptable",
-                "Minimal security deposit required",
-                "Excellent rental history expected"
-            ])
-            
-        return recommendations
+        return SCORE_RECOMMENDATIONS[bisect_right(RECOMMENDATION_SCORE_THRESHOLDS, credit_score)]
+    
+    def _consumer_key(self, request: CreditCheckRequest) -> bytes:
+        """Key identifying the same consumer pulled from the same bureau"""
+        h = hashlib.blake2b(digest_size=16, key=self._key_salt)
+        h.update(request.ssn.encode('utf-8'))
+        h.update(b"|")
+        h.update(request.bureau.value.encode('utf-8'))
+        h.update(b"|")
+        h.update(request.date_of_birth.encode('utf-8'))
+        return h.digest()
     
     async def perform_credit_check(self, request: CreditCheckRequest) -> CreditReport:
         """Perform comprehensive credit check"""
+        key = self._consumer_key(request)
+        
+        cached = self._report_cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            logger.info(f"Credit check served from cache: {request.request_id} via {request.bureau.value}")
+            report = replace(cached, request_id=request.request_id)
+            # Every request that receives a report gets its own audit entry
+            await self._write_queue.put(("audit", request, report, datetime.now().isoformat(), "cache"))
+            return report
+        
+        # A pull for the same consumer is already running: share its result
+        pull = self._inflight.get(key)
+        joined = pull is not None
+        if joined:
+            logger.info(f"Joining in-flight credit check: {request.request_id} via {request.bureau.value}")
+        else:
+            pull = asyncio.ensure_future(self._pull_credit_report(key, request))
+            # Retrieve the outcome so a failure nobody is still awaiting is not reported as unhandled
+            pull.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[key] = pull
+        
+        # Shielded so that cancelling one caller never cancels the pull other callers share;
+        # only when the last caller gives up is the pull itself cancelled
+        self._inflight_waiters[key] = self._inflight_waiters.get(key, 0) + 1
+        try:
+            report = await asyncio.shield(pull)
+        except asyncio.CancelledError:
+            if self._inflight_waiters[key] == 1 and not pull.done():
+                pull.cancel()
+            raise
+        finally:
+            self._inflight_waiters[key] -= 1
+            if not self._inflight_waiters[key]:
+                del self._inflight_waiters[key]
+        if joined:
+            report = replace(report, request_id=request.request_id)
+            await self._write_queue.put(("audit", request, report, datetime.now().isoformat(), "coalesced"))
+        return report
+    
+    async def _pull_credit_report(self, key: bytes, request: CreditCheckRequest) -> CreditReport:
+        """Run one shared credit pull and cache its report"""
+        try:
+            report = await self._perform_credit_check(request)
+            self._report_cache.set(key, report)
+            return report
+        finally:
+            del self._inflight[key]
+    
+    async def _perform_credit_check(self, request: CreditCheckRequest) -> CreditReport:
         logger.info(f"Starting credit check: {request.request_id} via {request.bureau.value}")
+        # One timestamp for the report, its audit entry and its stored copy
+        now_iso = datetime.now().isoformat()
         
         try:
             # Make request to credit bureau
             response_data = await self._make_credit_request(request.bureau, request)
             
             # Parse response
-            credit_report = self._parse_credit_response(request.bureau, response_data, request.request_id)
-            
-            # Log for audit
-            await self._audit_log_request(request, credit_report)
+            credit_report = self._parse_credit_response(request.bureau, response_data, request.request_id, now_iso)
             
-            # Store result
-            await self._store_credit_report(credit_report)
+            # Hand audit and storage to the background writer; put() blocks when it falls behind
+            await self._write_queue.put(("audit", request, credit_report, now_iso, "bureau"))
+            await self._write_queue.put(("store", credit_report, now_iso))
             
             logger.info(f"Credit check completed: {request.request_id}")
             return credit_report
@@ -440,12 +746,13 @@ class CreditBureauAgent:
             logger.error(f"Credit check failed: {request.request_id} - {str(e)}")
             raise
     
-    async def _audit_log_request(self, request: CreditCheckRequest, report: CreditReport):
-        """Log request for audit trail"""
+    async def _audit_log_request(self, request: CreditCheckRequest, report: CreditReport, now_iso: str, source: str):
+        """Log request for audit trail; source is bureau, cache or coalesced"""
         audit_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "request_id": request.request_id,
             "bureau": request.bureau.value,
+            "source": source,
             "score": report.credit_score.score,
             "risk_level": report.risk_level,
             "user_id": "system",  # Should be passed from calling system
@@ -456,55 +763,48 @@ class CreditBureauAgent:
             }
         }
         
-        audit_path = "/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/audit_log.json"
-        
         try:
             # Append to audit log
-            if os.path.exists(audit_path):
-                with open(audit_path, 'r') as f:
-                    audit_log = json.load(f)
-            else:
-                audit_log = []
-                
-            audit_log.append(audit_data)
-            
-            with open(audit_path, 'w') as f:
-                json.dump(audit_log, f, indent=2)
-                
+            self.audit_writer.append(audit_data)
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
     
-    async def _store_credit_report(self, report: CreditReport):
+    async def _writer_loop(self):
+        """Drain queued audit and storage writes in batches until the close sentinel"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch = [await self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE and not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+            
+            reports = []
+            for item in batch:
+                if item is None:
+                    stopping = True
+                elif item[0] == "audit":
+                    await self._audit_log_request(*item[1:])
+                else:
+                    reports.append(item[1:])
+            
+            if reports:
+                await loop.run_in_executor(None, self._store_credit_reports, reports)
+    
+    def _store_credit_reports(self, reports: List[tuple]):
+        """Store a batch of (report, now_iso) pairs; runs in the default executor"""
+        for report, now_iso in reports:
+            self._store_credit_report(report, now_iso)
+    
+    def _store_credit_report(self, report: CreditReport, now_iso: str):
         """Store credit report in secure storage"""
-        storage_path = f"/Users/user/Documents/TAURUS AI Corp./CURSOR Projects/TAURUS-AI-CORP-PORTFOLIO/03-REVENUE-SYSTEMS/PROPERTYVET-BACKGROUND-SYSTEM/08-DATA/credit_reports/{report.request_id}.json"
+        storage_path = os.path.join(CREDIT_REPORTS_DIR, f"{report.request_id}.json")
         
         try:
-            os.makedirs(os.path.dirname(storage_path), exist_ok=True)
-            
-            # Convert to dictionary for storage
-            report_data = {
-                "request_id": report.request_id,
-                "consumer_id": report.consumer_id,
-                "credit_score": {
-                    "score": report.credit_score.score,
-                    "range_min": report.credit_score.range_min,
-                    "range_max": report.credit_score.range_max,
-                    "grade": report.credit_score.grade,
-                    "factors": report.credit_score.factors,
-                    "date_generated": report.credit_score.date_generated
-                },
-                "accounts": report.accounts,
-                "inquiries": report.inquiries,
-                "public_records": report.public_records,
-                "alerts": report.alerts,
-                "recommendations": report.recommendations,
-                "risk_level": report.risk_level,
-                "verification_status": report.verification_status,
-                "stored_at": datetime.now().isoformat()
-            }
+            # Shallow copy of the report fields; credit_score is serialized straight from the dataclass
+            report_data = dict(report.__dict__, stored_at=now_iso)
             
-            with open(storage_path, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            with open(storage_path, 'wb') as f:
+                f.write(_dumps(report_data))
                 
             logger.info(f"Credit report stored: {report.request_id}")
             
@@ -513,11 +813,10 @@ class CreditBureauAgent:
     
     async def get_multiple_bureau_report(self, request_data: Dict) -> Dict[str, CreditReport]:
         """Get credit reports from multiple bureaus for comprehensive check"""
-        results = {}
-        
         bureaus = [CreditBureauProvider.EQUIFAX, CreditBureauProvider.TRANSUNION]
+        results = dict.fromkeys((bureau.value for bureau in bureaus), None)
         
-        tasks = []
+        tasks = {}
         for bureau in bureaus:
             request = CreditCheckRequest(
                 ssn=request_data["ssn"],
@@ -531,35 +830,60 @@ class CreditBureauAgent:
                 request_id=f"{request_data['request_id']}_{bureau.value}",
                 bureau=bureau
             )
-            tasks.append(self.perform_credit_check(request))
-        
-        # Execute all requests concurrently
-        reports = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks[asyncio.ensure_future(self.perform_credit_check(request))] = bureau
         
-        for i, report in enumerate(reports):
-            bureau = bureaus[i]
-            if isinstance(report, Exception):
-                logger.error(f"Failed to get report from {bureau.value}: {report}")
-                results[bureau.value] = None
-            else:
-                results[bureau.value] = report
+        # Execute all requests concurrently; a VERY_HIGH risk report already disqualifies the
+        # applicant, so the bureaus still pending are cancelled instead of being paid for.
+        # Cancelling only withdraws this request; a pull another request shares keeps running
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    bureau = tasks[task]
+                    if task.cancelled():
+                        logger.error(f"Report from {bureau.value} was cancelled")
+                        continue
+                    if task.exception() is not None:
+                        logger.error(f"Failed to get report from {bureau.value}: {task.exception()}")
+                        continue
+                    
+                    report = task.result()
+                    results[bureau.value] = report
+                    if report.risk_level == "VERY_HIGH" and pending:
+                        logger.info(f"Very high risk from {bureau.value}; skipping {', '.join(tasks[t].value for t in pending)}")
+                        for other in pending:
+                            other.cancel()
+                        await asyncio.wait(pending)
+                        pending = set()
+        finally:
+            for task in pending:
+                task.cancel()
         
         return results
     
     def get_agent_status(self) -> Dict:
         """Get current agent status and statistics"""
+        now = time.monotonic()
         return {
             "agent_name": "Credit Bureau Agent",
             "status": "OPERATIONAL",
             "version": "1.0.0",
             "total_requests": self.request_count,
+            "cache_hits": self.cache_hits,
+            "cached_reports": len(self._report_cache),
             "rate_limits": {
                 bureau.value: {
-                    "current": limit_info["current"],
-                    "max_per_minute": limit_info["max_per_minute"],
-                    "time_until_reset": max(0, 60 - (time.time() - limit_info["reset_time"]))
+                    "current": sum(1 for t in self._rl_windows[i] if t > now - RATE_LIMIT_WINDOW),
+                    "max_per_minute": RATE_LIMIT_PER_MINUTE[i],
+                    # Time until the oldest request in the window frees a slot
+                    "time_until_reset": max(0, self._rl_windows[i][0] + RATE_LIMIT_WINDOW - now) if self._rl_windows[i] else 0
                 }
-                for bureau, limit_info in self.rate_limits.items()
+                for bureau, i in BUREAU_INDEX.items()
+            },
+            "audit_log": {
+                "active_bucket": self.audit_writer.recent_buckets[-1] if self.audit_writer.recent_buckets else None,
+                "recent_buckets": len(self.audit_writer.recent_buckets)
             },
             "last_updated": datetime.now().isoformat(),
             "integrations": {
@@ -601,4 +925,6 @@ async def main():
         await agent.close()
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -5,25 +5,240 @@ Development tools and API integrations
 """
 
 import asyncio
+import copy
+import itertools
 import json
 import logging
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-import requests
+from types import MappingProxyType
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
+import aiohttp
 import os
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _dumps(data: Any) -> str:
+    """Serialize to 2-space indented JSON text"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+# Maximum provider integrations configured concurrently
+INTEGRATION_CONCURRENCY = 10
+
+# Most recently used tasks kept for get_task_status
+MAX_ACTIVE_TASKS = 1024
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a template literal: dicts become MappingProxyType at every level"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Mutable copy of a frozen template value; tuples of plain values are shared as they are"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple) and any(isinstance(item, MappingProxyType) for item in value):
+        return tuple(_thaw(item) for item in value)
+    return value
+
+# Static payment processing setup; setup_payment_processing adds the task_id
+PAYMENT_CONFIG_TEMPLATE = _freeze({
+    "stripe_integration": {
+        "status": "configured",
+        "webhook_url": "https://propvet.taurusai.io/api/webhooks/stripe",
+        "supported_currencies": ("USD", "CAD", "EUR"),
+        "payment_methods": ("card", "ach", "wire_transfer"),
+        "subscription_billing": True,
+        "one_time_payments": True
+    },
+    "pricing_tiers": (
+        {
+            "tier": "starter",
+            "price": 49,
+            "currency": "USD",
+            "billing_cycle": "monthly",
+            "features": ("50 background checks",)
+        },
+        {
+            "tier": "professional",
+            "price": 149,
+            "currency": "USD",
+            "billing_cycle": "monthly",
+            "features": ("200 background checks", "API access")
+        },
+        {
+            "tier": "enterprise",
+            "price": 449,
+            "currency": "USD",
+            "billing_cycle": "monthly",
+            "features": ("Unlimited checks", "White label")
+        }
+    ),
+    "security_features": {
+        "pci_compliance": True,
+        "fraud_detection": True,
+        "3d_secure": True,
+        "encryption": "AES-256"
+    }
+})
+
+# Static communication services setup; setup_communication_services adds the task_id
+COMMUNICATION_CONFIG_TEMPLATE = _freeze({
+    "email_service": {
+        "provider": "SendGrid",
+        "status": "configured",
+        "templates": (
+            {
+                "name": "background_check_complete",
+                "subject": "Your PropertyVet™ Background Check is Complete",
+                "type": "transactional"
+            },
+            {
+                "name": "subscription_welcome",
+                "subject": "Welcome to PropertyVet™",
+                "type": "welcome"
+            },
+            {
+                "name": "payment_receipt",
+                "subject": "Payment Confirmation - PropertyVet™",
+                "type": "receipt"
+            }
+        ),
+        "deliverability_score": 98.5
+    },
+    "sms_service": {
+        "provider": "Twilio",
+        "status": "configured",
+        "capabilities": (
+            "status_updates",
+            "security_alerts",
+            "two_factor_auth"
+        ),
+        "supported_countries": ("US", "CA", "UK", "AU")
+    },
+    "notification_system": {
+        "real_time_alerts": True,
+        "channels": ("email", "sms", "in_app", "webhook"),
+        "priority_levels": ("low", "medium", "high", "critical"),
+        "rate_limiting": {
+            "email": "100/hour",
+            "sms": "50/hour"
+        }
+    }
+})
+
+# Static monitoring and analytics setup; setup_monitoring_analytics adds the task_id
+MONITORING_CONFIG_TEMPLATE = _freeze({
+    "performance_monitoring": {
+        "uptime_monitoring": {
+            "status": "active",
+            "check_interval": "30 seconds",
+            "endpoints": (
+                "https://propvet.taurusai.io/api/health",
+                "https://propvet.taurusai.io/api/background-checks"
+            )
+        },
+        "response_time_tracking": {
+            "average_response_time": "245ms",
+            "p95_response_time": "450ms",
+            "p99_response_time": "680ms"
+        },
+        "error_tracking": {
+            "error_rate": "0.02%",
+            "alert_threshold": "1%",
+            "automatic_alerts": True
+        }
+    },
+    "business_analytics": {
+        "user_metrics": {
+            "daily_active_users": True,
+            "conversion_rates": True,
+            "customer_lifetime_value": True
+        },
+        "revenue_tracking": {
+            "monthly_recurring_revenue": True,
+            "churn_rate": True,
+            "average_revenue_per_user": True
+        },
+        "background_check_metrics": {
+            "checks_per_day": True,
+            "completion_time": True,
+            "accuracy_score": True
+        }
+    },
+    "security_monitoring": {
+        "intrusion_detection": True,
+        "vulnerability_scanning": True,
+        "compliance_monitoring": True,
+        "data_encryption_status": True
+    }
+})
+
+# Setup task type -> (task id prefix, log label, simulated seconds, result template)
+SETUP_TASKS = {
+    "payment_setup": ("payment_setup", "payment processing", 2, PAYMENT_CONFIG_TEMPLATE),
+    "communication_setup": ("comm_setup", "communication services", 2, COMMUNICATION_CONFIG_TEMPLATE),
+    "monitoring_setup": ("monitor_setup", "monitoring and analytics", 2, MONITORING_CONFIG_TEMPLATE),
+    "api_integrations": ("api_setup", "API integrations", 0, None)
+}
+
+# Parsed config files keyed by absolute path, as (st_mtime_ns, config)
+_config_file_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+def _read_config_file(path: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON config file, reusing the last parse while its mtime is unchanged"""
+    path = os.path.abspath(path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    
+    cached = _config_file_cache.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        with open(path, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
+        cached = _config_file_cache[path] = (mtime_ns, config)
+    return cached[1]
+
 class Dev21MCPAgent:
     """21.Dev MCP Agent for PropertyVet™ development tools"""
     
+    # Shared by every agent so task ids stay unique within the process; the random run id
+    # keeps them unique across processes and restarts, where the counter starts over
+    _task_counter = itertools.count(1)
+    _run_id = uuid.uuid4().hex[:8]
+    
     def __init__(self, config_path: str = None):
         self.agent_id = "dev21_mcp_agent"
         self.version = "1.0.0"
         self.status = "initializing"
         self.config = self._load_config(config_path)
         self.logger = self._setup_logging()
+        self._simulate = self.config.get("simulate_latency", False)
         self.api_key = os.getenv("DEV21_API_KEY", "your_dev21_api_key")
         self.base_url = "https://api.21.dev"
-        self.active_tasks = {}
+        self.active_tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.session = None
+        self._integration_sem = None
+        self._iso_cached = ""
+        self._iso_cached_at = None
+        self._integration_setups = {
+            "credit_bureaus": self._setup_credit_bureaus,
+            "identity_verification": self._setup_identity_verification,
+            "employment_verification": self._setup_employment_verification,
+            "public_records": self._setup_public_records
+        }
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load 21.Dev MCP configuration"""
@@ -56,16 +271,35 @@ class Dev21MCPAgent:
                 "load_balancing": True,
                 "failover_management": True,
                 "backup_automation": True
-            }
+            },
+            "simulate_latency": False,  # Demo delays in place of real provider calls
+            "health_check_url": None  # Probed by initialize() when set; otherwise the connection check stays offline
         }
         
-        if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                custom_config = json.load(f)
-                default_config.update(custom_config)
+        if config_path:
+            custom_config = _read_config_file(config_path)
+            if custom_config is not None:
+                # Copy so agents never share mutable config sections
+                default_config.update(copy.deepcopy(custom_config))
         
         return default_config
     
+    def _now_iso(self) -> str:
+        """Current local time as an ISO 8601 string, reformatted at most every 1ms"""
+        now = time.monotonic_ns()
+        if self._iso_cached_at is None or now - self._iso_cached_at > 1_000_000:
+            self._iso_cached = datetime.now().isoformat()
+            self._iso_cached_at = now
+        return self._iso_cached
+    
+    def _record_task(self, task_id: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Track a task, evicting the least recently used ones past MAX_ACTIVE_TASKS"""
+        self.active_tasks[task_id] = entry
+        self.active_tasks.move_to_end(task_id)
+        while len(self.active_tasks) > MAX_ACTIVE_TASKS:
+            self.active_tasks.popitem(last=False)
+        return entry
+    
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for 21.Dev MCP Agent"""
         logger = logging.getLogger(self.agent_id)
@@ -86,6 +320,17 @@ class Dev21MCPAgent:
         try:
             self.logger.info("Initializing 21.Dev MCP Agent...")
             
+            # Shared aiohttp session for all outbound 21.Dev API calls; kept when re-initializing
+            if self.session is None:
+                connector = aiohttp.TCPConnector(
+                    limit=100, limit_per_host=20, keepalive_timeout=30, enable_cleanup_closed=True
+                )
+                self.session = aiohttp.ClientSession(
+                    connector=connector,
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    timeout=aiohttp.ClientTimeout(total=10)
+                )
+            
             # Test API connection
             api_test = await self._test_api_connection()
             
@@ -106,26 +351,46 @@ class Dev21MCPAgent:
                         "cloud_services_management"
                     ],
                     "api_connection": api_test,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": self._now_iso()
                 }
             else:
                 self.status = "error"
+                await self._close_session()
                 return api_test
                 
         except Exception as e:
             self.status = "error"
-            self.logger.error(f"Failed to initialize 21.Dev MCP Agent: {str(e)}")
+            self.logger.error("Failed to initialize 21.Dev MCP Agent: %s", e)
+            await self._close_session()
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
     
+    async def _close_session(self):
+        """Close the aiohttp session if one is open"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
     async def _test_api_connection(self) -> Dict[str, Any]:
         """Test 21.Dev API connection"""
         try:
             self.logger.info("Testing 21.Dev API connection...")
-            await asyncio.sleep(0.5)
+            
+            health_check_url = self.config.get("health_check_url")
+            if health_check_url:
+                async with self.session.get(health_check_url) as response:
+                    if response.status != 200:
+                        return {
+                            "status": "error",
+                            "error": f"API connection failed: HTTP {response.status}",
+                            "timestamp": self._now_iso()
+                        }
+            elif self._simulate:
+                # No health endpoint configured; simulate a successful connection
+                await asyncio.sleep(0.5)
             
             return {
                 "status": "success",
@@ -137,80 +402,50 @@ class Dev21MCPAgent:
                     "Security Tools",
                     "Analytics Platform"
                 ],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
             
         except Exception as e:
             return {
                 "status": "error",
                 "error": f"API connection failed: {str(e)}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
     
-    async def setup_payment_processing(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Setup payment processing for PropertyVet™"""
-        task_id = f"payment_setup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    async def _run_setup(
+        self,
+        task_type: str,
+        builder: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """Run a tracked setup task; the result comes from builder or the SETUP_TASKS template"""
+        prefix, label, delay, template = SETUP_TASKS[task_type]
+        task_id = f"{prefix}_{self._run_id}_{next(self._task_counter):08x}"
         
         try:
-            self.logger.info(f"Setting up payment processing: {task_id}")
+            self.logger.info("Setting up %s: %s", label, task_id)
             
-            self.active_tasks[task_id] = {
-                "start_time": datetime.now(),
+            task = self._record_task(task_id, {
+                "start_time": time.monotonic(),
                 "status": "processing",
-                "type": "payment_setup"
-            }
+                "type": task_type
+            })
             
-            await asyncio.sleep(2)  # Simulate setup time
+            if self._simulate and delay:
+                await asyncio.sleep(delay)  # Simulate setup time
             
-            payment_config = {
-                "task_id": task_id,
-                "stripe_integration": {
-                    "status": "configured",
-                    "webhook_url": "https://propvet.taurusai.io/api/webhooks/stripe",
-                    "supported_currencies": ["USD", "CAD", "EUR"],
-                    "payment_methods": ["card", "ach", "wire_transfer"],
-                    "subscription_billing": True,
-                    "one_time_payments": True
-                },
-                "pricing_tiers": [
-                    {
-                        "tier": "starter",
-                        "price": 49,
-                        "currency": "USD",
-                        "billing_cycle": "monthly",
-                        "features": ["50 background checks"]
-                    },
-                    {
-                        "tier": "professional", 
-                        "price": 149,
-                        "currency": "USD",
-                        "billing_cycle": "monthly",
-                        "features": ["200 background checks", "API access"]
-                    },
-                    {
-                        "tier": "enterprise",
-                        "price": 449,
-                        "currency": "USD", 
-                        "billing_cycle": "monthly",
-                        "features": ["Unlimited checks", "White label"]
-                    }
-                ],
-                "security_features": {
-                    "pci_compliance": True,
-                    "fraud_detection": True,
-                    "3d_secure": True,
-                    "encryption": "AES-256"
-                }
-            }
+            if builder is not None:
+                result = await builder(task_id)
+            else:
+                result = {"task_id": task_id, **_thaw(template)}
             
-            self.active_tasks[task_id]["status"] = "completed"
-            self.active_tasks[task_id]["results"] = payment_config
+            task["status"] = "completed"
+            task["results"] = result
             
-            self.logger.info(f"Payment processing setup completed: {task_id}")
-            return payment_config
+            self.logger.info("Setup of %s completed: %s", label, task_id)
+            return result
             
         except Exception as e:
-            self.logger.error(f"Payment setup failed for task {task_id}: {str(e)}")
+            self.logger.error("Setup of %s failed for task %s: %s", label, task_id, e)
             if task_id in self.active_tasks:
                 self.active_tasks[task_id]["status"] = "failed"
                 self.active_tasks[task_id]["error"] = str(e)
@@ -219,230 +454,100 @@ class Dev21MCPAgent:
                 "task_id": task_id,
                 "status": "failed",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
     
+    async def setup_payment_processing(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Setup payment processing for PropertyVet™"""
+        return await self._run_setup("payment_setup")
+    
     async def setup_communication_services(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Setup communication services (SMS, Email, Notifications)"""
-        task_id = f"comm_setup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        try:
-            self.logger.info(f"Setting up communication services: {task_id}")
-            
-            self.active_tasks[task_id] = {
-                "start_time": datetime.now(),
-                "status": "processing",
-                "type": "communication_setup"
-            }
-            
-            await asyncio.sleep(2)
-            
-            comm_config = {
-                "task_id": task_id,
-                "email_service": {
-                    "provider": "SendGrid",
-                    "status": "configured",
-                    "templates": [
-                        {
-                            "name": "background_check_complete",
-                            "subject": "Your PropertyVet™ Background Check is Complete",
-                            "type": "transactional"
-                        },
-                        {
-                            "name": "subscription_welcome",
-                            "subject": "Welcome to PropertyVet™",
-                            "type": "welcome"
-                        },
-                        {
-                            "name": "payment_receipt",
-                            "subject": "Payment Confirmation - PropertyVet™",
-                            "type": "receipt"
-                        }
-                    ],
-                    "deliverability_score": 98.5
-                },
-                "sms_service": {
-                    "provider": "Twilio",
-                    "status": "configured",
-                    "capabilities": [
-                        "status_updates",
-                        "security_alerts",
-                        "two_factor_auth"
-                    ],
-                    "supported_countries": ["US", "CA", "UK", "AU"]
-                },
-                "notification_system": {
-                    "real_time_alerts": True,
-                    "channels": ["email", "sms", "in_app", "webhook"],
-                    "priority_levels": ["low", "medium", "high", "critical"],
-                    "rate_limiting": {
-                        "email": "100/hour",
-                        "sms": "50/hour"
-                    }
-                }
-            }
-            
-            self.active_tasks[task_id]["status"] = "completed"
-            self.active_tasks[task_id]["results"] = comm_config
-            
-            self.logger.info(f"Communication services setup completed: {task_id}")
-            return comm_config
-            
-        except Exception as e:
-            self.logger.error(f"Communication setup failed for task {task_id}: {str(e)}")
-            if task_id in self.active_tasks:
-                self.active_tasks[task_id]["status"] = "failed"
-                self.active_tasks[task_id]["error"] = str(e)
-            
-            return {
-                "task_id": task_id,
-                "status": "failed",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
+        return await self._run_setup("communication_setup")
     
     async def setup_monitoring_analytics(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Setup monitoring and analytics system"""
-        task_id = f"monitor_setup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        try:
-            self.logger.info(f"Setting up monitoring and analytics: {task_id}")
-            
-            self.active_tasks[task_id] = {
-                "start_time": datetime.now(),
-                "status": "processing",
-                "type": "monitoring_setup"
-            }
-            
-            await asyncio.sleep(2)
-            
-            monitoring_config = {
-                "task_id": task_id,
-                "performance_monitoring": {
-                    "uptime_monitoring": {
-                        "status": "active",
-                        "check_interval": "30 seconds",
-                        "endpoints": [
-                            "https://propvet.taurusai.io/api/health",
-                            "https://propvet.taurusai.io/api/background-checks"
-                        ]
-                    },
-                    "response_time_tracking": {
-                        "average_response_time": "245ms",
-                        "p95_response_time": "450ms",
-                        "p99_response_time": "680ms"
-                    },
-                    "error_tracking": {
-                        "error_rate": "0.02%",
-                        "alert_threshold": "1%",
-                        "automatic_alerts": True
-                    }
-                },
-                "business_analytics": {
-                    "user_metrics": {
-                        "daily_active_users": True,
-                        "conversion_rates": True,
-                        "customer_lifetime_value": True
-                    },
-                    "revenue_tracking": {
-                        "monthly_recurring_revenue": True,
-                        "churn_rate": True,
-                        "average_revenue_per_user": True
-                    },
-                    "background_check_metrics": {
-                        "checks_per_day": True,
-                        "completion_time": True,
-                        "accuracy_score": True
-                    }
-                },
-                "security_monitoring": {
-                    "intrusion_detection": True,
-                    "vulnerability_scanning": True,
-                    "compliance_monitoring": True,
-                    "data_encryption_status": True
-                }
-            }
-            
-            self.active_tasks[task_id]["status"] = "completed"
-            self.active_tasks[task_id]["results"] = monitoring_config
-            
-            self.logger.info(f"Monitoring and analytics setup completed: {task_id}")
-            return monitoring_config
-            
-        except Exception as e:
-            self.logger.error(f"Monitoring setup failed for task {task_id}: {str(e)}")
-            if task_id in self.active_tasks:
-                self.active_tasks[task_id]["status"] = "failed"
-                self.active_tasks[task_id]["error"] = str(e)
-            
-            return {
-                "task_id": task_id,
-                "status": "failed",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
+        return await self._run_setup("monitoring_setup")
     
     async def setup_api_integrations(self, integrations: List[str]) -> Dict[str, Any]:
         """Setup various API integrations"""
-        task_id = f"api_setup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return await self._run_setup(
+            "api_integrations",
+            lambda task_id: self._configure_integrations(task_id, integrations)
+        )
+    
+    async def _configure_integrations(self, task_id: str, integrations: List[str]) -> Dict[str, Any]:
+        """Configure the requested provider integrations concurrently"""
+        if self._integration_sem is None:
+            self._integration_sem = asyncio.Semaphore(INTEGRATION_CONCURRENCY)
         
-        try:
-            self.logger.info(f"Setting up API integrations: {task_id}")
-            
-            self.active_tasks[task_id] = {
-                "start_time": datetime.now(),
-                "status": "processing",
-                "type": "api_integrations"
+        integration_results = {
+            "task_id": task_id,
+            "integrations_configured": {}
+        }
+        
+        names = [name for name in dict.fromkeys(integrations) if name in self._integration_setups]
+        if len(names) > 1:
+            results = await asyncio.gather(
+                *(self._integration_setups[name]() for name in names),
+                return_exceptions=True
+            )
+        else:
+            # Nothing to overlap with zero or one provider; await it directly
+            results = []
+            for name in names:
+                try:
+                    results.append(await self._integration_setups[name]())
+                except Exception as e:
+                    results.append(e)
+        
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                self.logger.error("Integration %s failed for task %s: %s", name, task_id, result)
+                result = {"status": "failed", "error": str(result)}
+            integration_results["integrations_configured"][name] = result
+        
+        return integration_results
+    
+    async def _setup_credit_bureaus(self) -> Dict[str, Any]:
+        """Configure credit bureau integrations"""
+        async with self._integration_sem:
+            if self._simulate:
+                await asyncio.sleep(3)  # Simulate provider setup time
+            return {
+                "experian": {"status": "connected", "api_version": "v2"},
+                "equifax": {"status": "connected", "api_version": "v1.5"},
+                "transunion": {"status": "connected", "api_version": "v2.1"}
             }
-            
-            await asyncio.sleep(3)
-            
-            integration_results = {
-                "task_id": task_id,
-                "integrations_configured": {}
+    
+    async def _setup_identity_verification(self) -> Dict[str, Any]:
+        """Configure identity verification integrations"""
+        async with self._integration_sem:
+            if self._simulate:
+                await asyncio.sleep(3)
+            return {
+                "jumio": {"status": "connected", "verification_types": ["ID", "Selfie"]},
+                "onfido": {"status": "connected", "verification_types": ["Document", "Biometric"]}
             }
-            
-            # Configure each requested integration
-            for integration in integrations:
-                if integration == "credit_bureaus":
-                    integration_results["integrations_configured"]["credit_bureaus"] = {
-                        "experian": {"status": "connected", "api_version": "v2"},
-                        "equifax": {"status": "connected", "api_version": "v1.5"},
-                        "transunion": {"status": "connected", "api_version": "v2.1"}
-                    }
-                elif integration == "identity_verification":
-                    integration_results["integrations_configured"]["identity_verification"] = {
-                        "jumio": {"status": "connected", "verification_types": ["ID", "Selfie"]},
-                        "onfido": {"status": "connected", "verification_types": ["Document", "Biometric"]}
-                    }
-                elif integration == "employment_verification":
-                    integration_results["integrations_configured"]["employment_verification"] = {
-                        "theworknumber": {"status": "connected", "coverage": "US"},
-                        "truework": {"status": "connected", "coverage": "US/CA"}
-                    }
-                elif integration == "public_records":
-                    integration_results["integrations_configured"]["public_records"] = {
-                        "lexisnexis": {"status": "connected", "data_types": ["Criminal", "Civil"]},
-                        "thomson_reuters": {"status": "connected", "data_types": ["Property", "Business"]}
-                    }
-            
-            self.active_tasks[task_id]["status"] = "completed"
-            self.active_tasks[task_id]["results"] = integration_results
-            
-            self.logger.info(f"API integrations setup completed: {task_id}")
-            return integration_results
-            
-        except Exception as e:
-            self.logger.error(f"API integrations setup failed for task {task_id}: {str(e)}")
-            if task_id in self.active_tasks:
-                self.active_tasks[task_id]["status"] = "failed"
-                self.active_tasks[task_id]["error"] = str(e)
-            
+    
+    async def _setup_employment_verification(self) -> Dict[str, Any]:
+        """Configure employment verification integrations"""
+        async with self._integration_sem:
+            if self._simulate:
+                await asyncio.sleep(3)
             return {
-                "task_id": task_id,
-                "status": "failed",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "theworknumber": {"status": "connected", "coverage": "US"},
+                "truework": {"status": "connected", "coverage": "US/CA"}
+            }
+    
+    async def _setup_public_records(self) -> Dict[str, Any]:
+        """Configure public records integrations"""
+        async with self._integration_sem:
+            if self._simulate:
+                await asyncio.sleep(3)
+            return {
+                "lexisnexis": {"status": "connected", "data_types": ["Criminal", "Civil"]},
+                "thomson_reuters": {"status": "connected", "data_types": ["Property", "Business"]}
             }
     
     async def get_system_health(self) -> Dict[str, Any]:
@@ -450,11 +555,12 @@ class Dev21MCPAgent:
         try:
             self.logger.info("Retrieving system health status...")
             
-            await asyncio.sleep(1)
+            if self._simulate:
+                await asyncio.sleep(1)
             
             return {
                 "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now_iso(),
                 "services": {
                     "api_gateway": {
                         "status": "healthy",
@@ -493,11 +599,11 @@ class Dev21MCPAgent:
             }
             
         except Exception as e:
-            self.logger.error(f"Failed to retrieve system health: {str(e)}")
+            self.logger.error("Failed to retrieve system health: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
     
     async def get_task_status(self, task_id: str) -> Dict[str, Any]:
@@ -506,19 +612,22 @@ class Dev21MCPAgent:
             return {
                 "status": "error",
                 "error": "Task not found",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
         
+        self.active_tasks.move_to_end(task_id)
         return {
             "task_id": task_id,
             "status": self.active_tasks[task_id]["status"],
             "results": self.active_tasks[task_id].get("results", {}),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso()
         }
     
     async def cleanup(self) -> Dict[str, Any]:
         """Cleanup 21.Dev MCP Agent resources"""
         try:
+            await self._close_session()
+            
             self.status = "stopped"
             self.active_tasks.clear()
             self.logger.info("21.Dev MCP Agent cleanup completed")
@@ -526,15 +635,15 @@ class Dev21MCPAgent:
             return {
                 "status": "success",
                 "message": "Agent cleanup completed",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
             
         except Exception as e:
-            self.logger.error(f"Cleanup failed: {str(e)}")
+            self.logger.error("Cleanup failed: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()
             }
 
 # PropertyVet™ Integration
@@ -544,20 +653,20 @@ async def main():
     
     # Initialize agent
     init_result = await agent.initialize()
-    print(f"Initialization: {json.dumps(init_result, indent=2)}")
+    print(f"Initialization: {_dumps(init_result)}")
     
     if init_result["status"] == "success":
         # Test payment processing setup
         payment_result = await agent.setup_payment_processing({})
-        print(f"Payment Setup: {json.dumps(payment_result, indent=2)}")
+        print(f"Payment Setup: {_dumps(payment_result)}")
         
         # Test system health
         health_result = await agent.get_system_health()
-        print(f"System Health: {json.dumps(health_result, indent=2)}")
+        print(f"System Health: {_dumps(health_result)}")
     
     # Cleanup
     cleanup_result = await agent.cleanup()
-    print(f"Cleanup: {json.dumps(cleanup_result, indent=2)}")
+    print(f"Cleanup: {_dumps(cleanup_result)}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file